@@ -8,12 +8,33 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import threading
+import time
 
 from src.gemini.session import GeminiSession
 from src.hardware.interfaces import AudioInput
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on chunks buffered between the reader thread and the async
+# consumer. When the consumer falls behind, the reader paces itself to
+# real time instead of growing the queue without limit.
+_MAX_QUEUED_CHUNKS = 32
+
+
+def _raise_thread_priority() -> None:
+    """Best-effort: promote the calling thread to real-time scheduling.
+
+    Uses SCHED_FIFO so the microphone read thread is not preempted by
+    general-purpose work. Falls back silently when the platform has no
+    scheduler control or the process lacks permission.
+    """
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+    except (AttributeError, PermissionError, OSError):
+        logger.debug("Could not raise audio capture thread priority.")
+
 
 class AudioCaptureStream:
     """Streams PCM audio from AudioInput to a Gemini session.
@@ -25,10 +46,24 @@ class AudioCaptureStream:
         chunk_size: Bytes per audio chunk.
     """
 
+    __slots__ = (
+        "_audio_input",
+        "_session",
+        "_sample_rate",
+        "_chunk_size",
+        "_streaming",
+        "_task",
+        "_reader_thread",
+        "_queue",
+        "_loop",
+        "_chunk_seconds",
+        "_batch_bytes",
+    )
+
     def __init__(
         self,
         audio_input: AudioInput,
-        session: GeminiSession,
+        session: GeminiSession | None = None,
         sample_rate: int = 16000,
         chunk_size: int = 1024,
     ) -> None:
@@ -38,11 +73,44 @@ class AudioCaptureStream:
         self._chunk_size = chunk_size
         self._streaming = False
         self._task: asyncio.Task | None = None
+        # Dedicated producer thread so mic reads never queue behind other
+        # blocking work on the shared default thread pool, and each chunk
+        # skips the per-call executor round-trip.
+        self._reader_thread: threading.Thread | None = None
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._chunk_seconds = chunk_size / 2 / sample_rate
+        # Batch outgoing audio into fewer websocket frames (header + TLS
+        # record per send), capped at 64 ms so responsiveness holds.
+        max_batch = sample_rate * 2 * 64 // 1000
+        self._batch_bytes = max(chunk_size, max_batch // chunk_size * chunk_size)
+
+    def bind_session(self, session: GeminiSession) -> None:
+        """Attach the Gemini session to stream into.
+
+        The stream object is reused across conversations; each new
+        session is bound here before start().
+
+        Args:
+            session: Connected Gemini session.
+
+        Raises:
+            RuntimeError: If called while capture is active.
+        """
+        if self._streaming:
+            raise RuntimeError("Cannot rebind session while streaming.")
+        self._session = session
 
     async def start(self) -> None:
-        """Begin capturing and sending audio chunks to Gemini."""
+        """Begin capturing and sending audio chunks to Gemini.
+
+        Raises:
+            RuntimeError: If no session has been bound.
+        """
         if self._streaming:
             return
+        if self._session is None:
+            raise RuntimeError("No Gemini session bound to capture stream.")
 
         if not self._audio_input.is_open():
             self._audio_input.open_stream(
@@ -50,6 +118,12 @@ class AudioCaptureStream:
                 chunk_size=self._chunk_size,
             )
         self._streaming = True
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._reader_thread = threading.Thread(
+            target=self._blocking_reader, name="audio-capture", daemon=True
+        )
+        self._reader_thread.start()
         self._task = asyncio.create_task(self._capture_loop())
         logger.info(
             "Audio capture started (rate=%d, chunk=%d)",
@@ -60,14 +134,35 @@ class AudioCaptureStream:
     async def stop(self) -> None:
         """Stop capturing audio."""
         self._streaming = False
+        reader = self._reader_thread
+        self._reader_thread = None
+        if reader is not None:
+            reader.join(timeout=1.0)
+
         if self._task is not None:
-            self._task.cancel()
+            # The reader's exit sentinel lets the loop finish and flush
+            # buffered audio; cancel only if the send side is stuck.
             try:
-                await self._task
+                await asyncio.wait_for(self._task, timeout=2.0)
+            except asyncio.TimeoutError:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
             except asyncio.CancelledError:
                 pass
             self._task = None
 
+        if reader is not None:
+            if reader.is_alive():
+                # The thread may still be mid-read; closing the stream
+                # underneath it would be a use-after-close on real hardware.
+                logger.warning(
+                    "Audio reader thread did not exit; leaving stream open."
+                )
+                return
+
         if self._audio_input.is_open():
             self._audio_input.close_stream()
         logger.info("Audio capture stopped.")
@@ -77,17 +172,70 @@ class AudioCaptureStream:
         """Check if audio capture is active."""
         return self._streaming
 
+    def _blocking_reader(self) -> None:
+        """Producer thread — reads mic chunks and hands them to the loop.
+
+        Reads are paced to real time so a non-blocking source (such as
+        the file-backed stub) cannot flood the event loop, and chunks are
+        dropped rather than buffered without bound if the consumer stalls.
+        On exit (normal or error) it enqueues a ``None`` sentinel so the
+        consumer never blocks on a dead producer.
+        """
+        # NOTE: logs inside this loop and _capture_loop run at audio rate.
+        # Use %s placeholders (never f-strings) and guard debug-level
+        # logging with isEnabledFor so formatting cost stays off the
+        # audio path when the level is disabled.
+        _raise_thread_priority()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        deadline = time.monotonic()
+        try:
+            while self._streaming:
+                chunk = self._audio_input.read_chunk()
+                # A real microphone blocks for the chunk interval inside
+                # read_chunk; only sleep off whatever time remains.
+                deadline += self._chunk_seconds
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    deadline = time.monotonic()
+                if not self._streaming:
+                    break
+                if self._queue.qsize() >= _MAX_QUEUED_CHUNKS:
+                    if debug_enabled:
+                        logger.debug("Capture queue full; dropping chunk.")
+                    continue
+                self._loop.call_soon_threadsafe(self._queue.put_nowait, chunk)
+        except Exception as e:
+            logger.error("Audio reader thread error: %s", e)
+        finally:
+            try:
+                self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
+            except RuntimeError:
+                pass  # Event loop already closed during shutdown.
+
     async def _capture_loop(self) -> None:
-        """Main capture loop — reads chunks and sends to Gemini."""
-        loop = asyncio.get_event_loop()
+        """Main capture loop — consumes queued chunks and sends to Gemini."""
+        # Bind lookups once — this loop runs tens of times per second.
+        session = self._session
+        get = self._queue.get
+        send_buf = bytearray()
+        batch_bytes = self._batch_bytes
         try:
             while self._streaming:
-                chunk = await loop.run_in_executor(
-                    None, self._audio_input.read_chunk
-                )
-                if self._streaming and self._session.is_connected:
-                    await self._session.send_audio(chunk)
-                await asyncio.sleep(0)
+                chunk = await get()
+                if chunk is None:
+                    # Reader thread exited (error or shutdown).
+                    self._streaming = False
+                    break
+                if self._streaming and session.is_connected:
+                    send_buf += chunk
+                    if len(send_buf) >= batch_bytes:
+                        await session.send_audio(bytes(send_buf))
+                        send_buf.clear()
+            # Graceful exit: flush whatever audio is still buffered.
+            if send_buf and session.is_connected:
+                await session.send_audio(bytes(send_buf))
         except asyncio.CancelledError:
             raise
         except Exception as e:
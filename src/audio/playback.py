@@ -7,6 +7,7 @@ and plays through an AudioOutput interface. Supports interruption.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import wave
 from pathlib import Path
@@ -15,6 +16,128 @@ from src.hardware.interfaces import AudioOutput
 
 logger = logging.getLogger(__name__)
 
+# Files above this size are streamed from disk chunk by chunk instead of
+# cached whole — the lru_cache below exists for the small, frequently
+# replayed phrase files, not for arbitrary recordings.
+_STREAM_THRESHOLD_BYTES = 1 << 20
+
+
+@functools.lru_cache(maxsize=16)
+def _load_wav(path: str) -> tuple[int, bytes]:
+    """Load and cache a WAV file's sample rate and PCM payload.
+
+    The cached error/status phrases are a handful of small files replayed
+    repeatedly; caching skips disk I/O and WAV parsing after the first play.
+
+    Args:
+        path: Path to a WAV file.
+
+    Returns:
+        Tuple of (sample_rate, pcm_data).
+    """
+    with wave.open(path, "rb") as wf:
+        return wf.getframerate(), wf.readframes(wf.getnframes())
+
+
+class _PCMRing:
+    """Single-producer/single-consumer ring of reusable PCM slots.
+
+    The producer (play_chunk) and consumer (_drain_loop) both run on the
+    event loop thread, so plain integer read/write cursors need no lock;
+    an asyncio.Event wakes the consumer without the per-operation lock
+    and waiter-Future allocation of asyncio.Queue. Slots are recycled
+    bytearrays, so steady-state streaming allocates nothing per chunk.
+
+    Args:
+        slot_bytes: Initial size of each slot (slots grow to fit).
+        capacity: Initial number of slots (doubles when full).
+    """
+
+    __slots__ = (
+        "_slots",
+        "_lengths",
+        "_read",
+        "_write",
+        "_capacity",
+        "_event",
+        "_closed",
+    )
+
+    def __init__(self, slot_bytes: int, capacity: int = 64) -> None:
+        self._slots = [bytearray(slot_bytes) for _ in range(capacity)]
+        self._lengths = [0] * capacity
+        self._read = 0
+        self._write = 0
+        self._capacity = capacity
+        self._event = asyncio.Event()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return self._write - self._read
+
+    @property
+    def closed(self) -> bool:
+        """True once the producer has signalled end of stream."""
+        return self._closed
+
+    def push(self, data: bytes) -> None:
+        """Copy a chunk into the next free slot, growing when full."""
+        if self._write - self._read == self._capacity:
+            self._grow()
+        idx = self._write % self._capacity
+        slot = self._slots[idx]
+        n = len(data)
+        if len(slot) < n:
+            slot = bytearray(n)
+            self._slots[idx] = slot
+        slot[:n] = data
+        self._lengths[idx] = n
+        self._write += 1
+        self._event.set()
+
+    def peek(self) -> tuple[bytearray, int]:
+        """Return the oldest (slot, length) without releasing the slot."""
+        idx = self._read % self._capacity
+        return self._slots[idx], self._lengths[idx]
+
+    def advance(self) -> None:
+        """Release the oldest slot for reuse after its data is consumed."""
+        self._read += 1
+
+    def close(self) -> None:
+        """Mark end of stream and wake the consumer."""
+        self._closed = True
+        self._event.set()
+
+    def clear(self) -> None:
+        """Drop all buffered chunks in O(1)."""
+        self._read = self._write
+
+    def reset(self) -> None:
+        """Drop buffered chunks and reopen for a new turn."""
+        self._read = self._write
+        self._closed = False
+        self._event.clear()
+
+    async def wait(self, count: int = 1) -> None:
+        """Wait until at least ``count`` chunks are buffered or closed."""
+        while self._write - self._read < count and not self._closed:
+            self._event.clear()
+            await self._event.wait()
+
+    def _grow(self) -> None:
+        """Double capacity, preserving FIFO order."""
+        cap = self._capacity
+        order = [(self._read + i) % cap for i in range(cap)]
+        slot_bytes = len(self._slots[0])
+        self._slots = [self._slots[i] for i in order] + [
+            bytearray(slot_bytes) for _ in range(cap)
+        ]
+        self._lengths = [self._lengths[i] for i in order] + [0] * cap
+        self._read = 0
+        self._write = cap
+        self._capacity = cap * 2
+
 
 class AudioPlaybackStream:
     """Plays PCM audio chunks through AudioOutput with buffering.
@@ -29,6 +152,17 @@ class AudioPlaybackStream:
         buffer_chunks: Number of chunks to buffer before starting playback.
     """
 
+    __slots__ = (
+        "_audio_output",
+        "_sample_rate",
+        "_buffer_chunks",
+        "_frame_bytes",
+        "_ring",
+        "_playing",
+        "_task",
+        "play_chunk",
+    )
+
     def __init__(
         self,
         audio_output: AudioOutput,
@@ -38,32 +172,45 @@ class AudioPlaybackStream:
         self._audio_output = audio_output
         self._sample_rate = sample_rate
         self._buffer_chunks = buffer_chunks
-        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        # Fixed output frame: 20 ms of 16-bit mono PCM (960 bytes @ 24 kHz).
+        # Writing uniform frames lets hardware backends use a fixed
+        # blocksize instead of resizing buffers per call.
+        self._frame_bytes = sample_rate * 2 * 20 // 1000
+        self._ring = _PCMRing(slot_bytes=self._frame_bytes)
         self._playing = False
         self._task: asyncio.Task | None = None
+        # play_chunk is rebound between a cold start-up path and a hot
+        # steady-state path, so the per-chunk call skips the "is the
+        # stream already running?" branch entirely.
+        self.play_chunk = self._play_chunk_cold
 
-    async def play_chunk(self, audio_data: bytes) -> None:
-        """Buffer and play a chunk of PCM audio.
+    async def _play_chunk_cold(self, audio_data: bytes) -> None:
+        """Buffer and play a chunk of PCM audio (public API: ``play_chunk``).
 
-        On the first call, opens the audio output stream and starts
-        a background drain task. Initial chunks are buffered before
-        playback begins.
+        On the first call of a turn, opens the audio output stream,
+        starts a background drain task, and rebinds ``play_chunk`` to
+        the hot path. Initial chunks are buffered before playback
+        begins.
 
         Args:
             audio_data: Raw PCM audio bytes (24kHz/16-bit/mono).
         """
-        if not self._playing:
-            if not self._audio_output.is_open():
-                self._audio_output.open_stream(sample_rate=self._sample_rate)
-            self._playing = True
-            self._task = asyncio.create_task(self._drain_loop())
+        if not self._audio_output.is_open():
+            self._audio_output.open_stream(sample_rate=self._sample_rate)
+        self._ring.reset()
+        self._playing = True
+        self._task = asyncio.create_task(self._drain_loop())
+        self.play_chunk = self._play_chunk_hot
+        self._ring.push(audio_data)
 
-        await self._queue.put(audio_data)
+    async def _play_chunk_hot(self, audio_data: bytes) -> None:
+        """Steady-state ``play_chunk``: push straight into the ring."""
+        self._ring.push(audio_data)
 
     async def flush(self) -> None:
         """Signal end of audio stream and wait for playback to finish."""
         if self._task is not None and not self._task.done():
-            await self._queue.put(None)
+            self._ring.close()
             try:
                 await self._task
             except asyncio.CancelledError:
@@ -72,6 +219,10 @@ class AudioPlaybackStream:
     async def play_file(self, file_path: str) -> None:
         """Play a local WAV file (for cached error phrases).
 
+        Small files are loaded whole and cached; files above the
+        streaming threshold are read in chunks so peak memory stays
+        bounded by one chunk regardless of file length.
+
         Args:
             file_path: Path to a WAV file.
         """
@@ -80,33 +231,52 @@ class AudioPlaybackStream:
             logger.warning("Audio file not found: %s", file_path)
             return
 
-        with wave.open(str(path), "rb") as wf:
-            sample_rate = wf.getframerate()
-            pcm_data = wf.readframes(wf.getnframes())
+        if path.stat().st_size > _STREAM_THRESHOLD_BYTES:
+            await self._play_file_streaming(path)
+            return
+
+        sample_rate, pcm_data = _load_wav(str(path))
 
         if not self._audio_output.is_open():
             self._audio_output.open_stream(sample_rate=sample_rate)
 
         self._playing = True
-        loop = asyncio.get_event_loop()
-        chunk_bytes = max(sample_rate * 2 // 10, 1024)
+        chunk_bytes = self._frame_bytes
+        # memoryview slices avoid materializing a new bytes per chunk.
+        view = memoryview(pcm_data)
         for i in range(0, len(pcm_data), chunk_bytes):
             if not self._playing:
                 break
-            chunk = pcm_data[i : i + chunk_bytes]
-            await loop.run_in_executor(
-                None, self._audio_output.write_chunk, chunk
+            await asyncio.to_thread(
+                self._audio_output.write_chunk, view[i : i + chunk_bytes]
             )
         self._playing = False
 
+    async def _play_file_streaming(self, path: Path) -> None:
+        """Stream a large WAV file to the output chunk by chunk.
+
+        Args:
+            path: Path to an existing WAV file.
+        """
+        chunk_frames = self._frame_bytes // 2  # 16-bit mono frames per chunk
+        self._playing = True
+        try:
+            with wave.open(str(path), "rb") as wf:
+                if not self._audio_output.is_open():
+                    self._audio_output.open_stream(sample_rate=wf.getframerate())
+                while self._playing:
+                    chunk = await asyncio.to_thread(wf.readframes, chunk_frames)
+                    if not chunk:
+                        break
+                    await asyncio.to_thread(self._audio_output.write_chunk, chunk)
+        finally:
+            self._playing = False
+
     def stop(self) -> None:
         """Immediately stop playback (for interruption)."""
         self._playing = False
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        self.play_chunk = self._play_chunk_cold
+        self._ring.clear()
         if self._task is not None:
             self._task.cancel()
             self._task = None
@@ -123,49 +293,73 @@ class AudioPlaybackStream:
         """Drain buffered audio chunks to the output.
 
         Waits for buffer_chunks to accumulate before writing any audio,
-        then continuously writes chunks as they arrive.
+        then continuously re-chunks into fixed-size frames and writes
+        them as chunks arrive.
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        # stop() cancels this task without awaiting it, so a new turn's
+        # cold path can install a fresh task before this one observes
+        # the cancellation — and asyncio.wait_for can even swallow the
+        # cancellation when the inner wait completes in the same window.
+        # Every state the task acts on after an await is therefore
+        # gated on still being the stream's current task; a stale task
+        # must neither drain the ring nor touch shared state.
+        task = asyncio.current_task()
+        # NOTE: any log added inside this loop runs at audio rate — use
+        # %s placeholders (never f-strings) and guard debug-level logging
+        # with logger.isEnabledFor(logging.DEBUG).
+        # Bind lookups once — this loop runs tens of times per second.
+        write = self._audio_output.write_chunk
+        run = loop.run_in_executor
+        ring = self._ring
+        frame = self._frame_bytes
+        carry = bytearray()
         try:
             # Phase 1: initial buffering
-            initial: list[bytes] = []
-            for _ in range(self._buffer_chunks):
-                try:
-                    chunk = await asyncio.wait_for(
-                        self._queue.get(), timeout=1.0
-                    )
-                except asyncio.TimeoutError:
-                    break
-                if chunk is None:
-                    break
-                initial.append(chunk)
-
-            # Phase 2: play buffered chunks
-            for chunk in initial:
-                if not self._playing:
-                    return
-                await loop.run_in_executor(
-                    None, self._audio_output.write_chunk, chunk
+            try:
+                await asyncio.wait_for(
+                    ring.wait(self._buffer_chunks), timeout=1.0
                 )
+            except asyncio.TimeoutError:
+                pass
 
-            # Phase 3: continue draining as chunks arrive
-            while self._playing:
-                try:
-                    chunk = await asyncio.wait_for(
-                        self._queue.get(), timeout=2.0
-                    )
-                except asyncio.TimeoutError:
-                    break
-                if chunk is None:
-                    break
-                if not self._playing:
-                    return
-                await loop.run_in_executor(
-                    None, self._audio_output.write_chunk, chunk
-                )
+            # Phase 2: drain chunks into fixed-size frames as they arrive.
+            # All currently-buffered chunks are coalesced into one executor
+            # dispatch, capped so stop() stays responsive mid-burst.
+            max_batch = frame * 8
+            while self._playing and self._task is task:
+                if not len(ring):
+                    if ring.closed:
+                        break
+                    # No timer needed: flush() closes the ring and stop()
+                    # cancels this task, so the wait always wakes.
+                    await ring.wait()
+                    continue
+                while len(ring) and len(carry) < max_batch:
+                    buf, n = ring.peek()
+                    carry += memoryview(buf)[:n]
+                    ring.advance()
+                batch = min(len(carry) // frame * frame, max_batch)
+                while batch:
+                    if not self._playing or self._task is not task:
+                        return
+                    await run(None, write, bytes(memoryview(carry)[:batch]))
+                    del carry[:batch]
+                    batch = min(len(carry) // frame * frame, max_batch)
+
+            # Zero-pad the tail so downstream only ever sees whole frames.
+            if self._playing and self._task is task and carry:
+                carry.extend(bytes(frame - len(carry)))
+                await run(None, write, bytes(carry))
         except asyncio.CancelledError:
             raise
         except Exception as e:
             logger.error("Playback drain error: %s", e)
         finally:
-            self._playing = False
+            # Same ownership rule for the finalizer: only the task that
+            # still owns the stream may reset it for the next turn.
+            if self._task is task:
+                self._playing = False
+                # The next chunk belongs to a new turn and must restart
+                # the drain task, so route it back through the cold path.
+                self.play_chunk = self._play_chunk_cold
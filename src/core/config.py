@@ -6,6 +6,7 @@ with environment variables taking precedence over YAML defaults.
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -14,6 +15,12 @@ from typing import Any
 import yaml
 from dotenv import load_dotenv
 
+try:
+    # libyaml-backed C loader: ~5-10x faster parsing, same safe schema.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 # Project root is two levels up from this file (src/core/config.py -> project root)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -54,19 +61,36 @@ class Settings:
 
 
 def _load_yaml_defaults(yaml_path: Path) -> dict[str, Any]:
-    """Load default values from a YAML config file.
+    """Load default values from a YAML config file, flattened to dot-paths.
+
+    Flattening once up front turns every subsequent lookup into a single
+    dict probe instead of a split-and-walk over nested dicts.
 
     Args:
         yaml_path: Path to the YAML configuration file.
 
     Returns:
-        Dictionary of configuration values. Empty dict if file not found.
+        Mapping of dot-separated key paths (e.g. "audio.input_sample_rate")
+        to values. Empty dict if file not found.
     """
     if not yaml_path.exists():
         return {}
     with open(yaml_path) as f:
-        data = yaml.safe_load(f)
-    return data if data else {}
+        data = yaml.load(f, Loader=_YamlLoader)
+    if not data:
+        return {}
+
+    flat: dict[str, Any] = {}
+
+    def _walk(node: dict[str, Any], prefix: str) -> None:
+        for key, value in node.items():
+            if isinstance(value, dict):
+                _walk(value, f"{prefix}{key}.")
+            else:
+                flat[f"{prefix}{key}"] = value
+
+    _walk(data, "")
+    return flat
 
 
 def _get(env_key: str, yaml_defaults: dict[str, Any], yaml_key: str, default: Any = None) -> Any:
@@ -74,7 +98,7 @@ def _get(env_key: str, yaml_defaults: dict[str, Any], yaml_key: str, default: An
 
     Args:
         env_key: Environment variable name.
-        yaml_defaults: Dictionary from YAML config file.
+        yaml_defaults: Flattened dot-path dictionary from the YAML file.
         yaml_key: Dot-separated key path in YAML (e.g., "audio.input_sample_rate").
         default: Fallback default value.
 
@@ -86,24 +110,20 @@ def _get(env_key: str, yaml_defaults: dict[str, Any], yaml_key: str, default: An
     if env_val is not None and env_val != "":
         return env_val
 
-    # Walk nested YAML keys
-    parts = yaml_key.split(".")
-    node = yaml_defaults
-    for part in parts:
-        if isinstance(node, dict) and part in node:
-            node = node[part]
-        else:
-            return default
-    return node if node is not None else default
+    val = yaml_defaults.get(yaml_key, default)
+    return val if val is not None else default
 
 
+@functools.lru_cache(maxsize=4)
 def load_settings(
     env_path: Path | None = None,
     yaml_path: Path | None = None,
 ) -> Settings:
     """Load settings from .env and config/default.yaml.
 
-    Environment variables take precedence over YAML defaults.
+    Environment variables take precedence over YAML defaults. Results are
+    cached per (env_path, yaml_path) — Settings is frozen, so repeated
+    callers share one instance instead of re-parsing the config files.
 
     Args:
         env_path: Path to .env file. Defaults to PROJECT_ROOT/.env.
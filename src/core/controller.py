@@ -8,8 +8,6 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import time
-from typing import Set
 
 from src.audio.capture import AudioCaptureStream
 from src.audio.playback import AudioPlaybackStream
@@ -17,7 +15,7 @@ from src.core.config import Settings
 from src.core.state_machine import RobotState
 from src.gemini.session import GeminiSession, GeminiSessionConfig, ServerMessage
 from src.hardware.interfaces import AudioInput, AudioOutput, CameraInput, DisplayOutput
-from src.personality.manager import PersonalityManager
+from src.personality.manager import get_manager
 from src.tools.server import ToolServer
 from src.wake_word.detector import WakeWordDetector
 
@@ -54,9 +52,13 @@ class RobotController:
 
         self._state = RobotState.IDLE
         self._running = False
-        self._stop_event: asyncio.Event | None = None
+        # Backing store for the lazily created _stop_event property.
+        self._stop_event_obj: asyncio.Event | None = None
+        # Persistent waiter on the stop event, shared across IDLE cycles
+        # instead of spawning and cancelling a fresh task per cycle.
+        self._stop_wait_task: asyncio.Task | None = None
 
-        self._personality_manager = PersonalityManager(settings.personalities_dir)
+        self._personality_manager = get_manager(settings.personalities_dir)
         self._wake_detector = WakeWordDetector(
             audio_input,
             wake_word=settings.wake_word,
@@ -66,9 +68,38 @@ class RobotController:
         self._tool_server.register_builtin_tools(display=display, camera=camera)
         self._tool_server.discover_user_tools()
 
+        # Audio streams are built once and reused across conversations;
+        # the capture stream is rebound to each new Gemini session.
+        self._capture = AudioCaptureStream(
+            audio_input,
+            sample_rate=settings.input_sample_rate,
+            chunk_size=settings.audio_chunk_size,
+        )
+        self._playback = AudioPlaybackStream(
+            audio_output,
+            sample_rate=settings.output_sample_rate,
+        )
+
         self._session: GeminiSession | None = None
-        self._last_activity = 0.0
         self._conversation_timeout = settings.conversation_timeout
+        # Event-driven silence timeout: re-armed on each activity instead
+        # of polling once per second for the whole conversation.
+        self._timeout_fired: asyncio.Event | None = None
+        self._timeout_handle: asyncio.TimerHandle | None = None
+
+        # O(1) message dispatch — bound once instead of an if/elif chain
+        # per message on the latency-sensitive receive path.
+        self._msg_handlers = {
+            "audio": self._on_audio,
+            "transcription": self._on_transcription,
+            "input_transcription": self._on_input_transcription,
+            "turn_complete": self._on_turn_complete,
+            "interrupted": self._on_interrupted,
+            "tool_call": self._on_tool_call,
+            "setup_complete": self._on_setup_complete,
+            "go_away": self._on_go_away,
+            "error": self._on_error,
+        }
 
     async def start(self) -> None:
         """Begin the main loop (wake word → conversation → idle).
@@ -80,7 +111,8 @@ class RobotController:
         4. Back to IDLE
         """
         self._running = True
-        self._stop_event = asyncio.Event()
+        self._stop_event.clear()
+        self._stop_wait_task = None
         self._state = RobotState.IDLE
         logger.info("Robot controller started.")
 
@@ -101,11 +133,18 @@ class RobotController:
             await self._cleanup()
             logger.info("Robot controller stopped.")
 
+    @property
+    def _stop_event(self) -> asyncio.Event:
+        """Stop signal, created on first use."""
+        event = self._stop_event_obj
+        if event is None:
+            event = self._stop_event_obj = asyncio.Event()
+        return event
+
     async def stop(self) -> None:
         """Graceful shutdown — exits the main loop."""
         self._running = False
-        if self._stop_event:
-            self._stop_event.set()
+        self._stop_event.set()
         self._wake_detector.stop()
         if self._session and self._session.is_connected:
             await self._session.close()
@@ -192,19 +231,13 @@ class RobotController:
 
         logger.info("Entering CONVERSATION state.")
 
-        capture = AudioCaptureStream(
-            self._audio_input,
-            self._session,
-            sample_rate=self._settings.input_sample_rate,
-            chunk_size=self._settings.audio_chunk_size,
-        )
-        playback = AudioPlaybackStream(
-            self._audio_output,
-            sample_rate=self._settings.output_sample_rate,
-        )
+        capture = self._capture
+        playback = self._playback
+        capture.bind_session(self._session)
 
         await capture.start()
-        self._last_activity = time.monotonic()
+        self._timeout_fired = asyncio.Event()
+        self._mark_activity()
 
         receive_task = asyncio.create_task(self._receive_loop(playback))
         timeout_task = asyncio.create_task(self._timeout_monitor())
@@ -221,6 +254,9 @@ class RobotController:
                 except asyncio.CancelledError:
                     pass
         finally:
+            if self._timeout_handle is not None:
+                self._timeout_handle.cancel()
+                self._timeout_handle = None
             await capture.stop()
             playback.stop()
             if self._session and self._session.is_connected:
@@ -249,54 +285,92 @@ class RobotController:
         self, msg: ServerMessage, playback: AudioPlaybackStream
     ) -> None:
         """Route a single Gemini message to the appropriate handler."""
-        if msg.type == "audio":
-            await playback.play_chunk(msg.audio_data)
+        handler = self._msg_handlers.get(msg.type)
+        if handler:
+            await handler(msg, playback)
 
-        elif msg.type == "transcription":
-            if self._display:
-                self._display.show_text(msg.text)
+    async def _on_audio(
+        self, msg: ServerMessage, playback: AudioPlaybackStream
+    ) -> None:
+        """Play an audio chunk through the speaker."""
+        await playback.play_chunk(msg.audio_data)
 
-        elif msg.type == "input_transcription":
-            self._last_activity = time.monotonic()
-            if self._display:
-                self._display.show_text(f"> {msg.text}")
+    async def _on_transcription(
+        self, msg: ServerMessage, playback: AudioPlaybackStream
+    ) -> None:
+        """Show Gemini's speech transcription on the display."""
+        if self._display:
+            self._display.show_text(msg.text)
 
-        elif msg.type == "turn_complete":
-            self._last_activity = time.monotonic()
-            await playback.flush()
+    async def _on_input_transcription(
+        self, msg: ServerMessage, playback: AudioPlaybackStream
+    ) -> None:
+        """Show the user's speech transcription and mark activity."""
+        self._mark_activity()
+        if self._display:
+            self._display.show_text(f"> {msg.text}")
 
-        elif msg.type == "interrupted":
-            playback.stop()
-            self._last_activity = time.monotonic()
+    async def _on_turn_complete(
+        self, msg: ServerMessage, playback: AudioPlaybackStream
+    ) -> None:
+        """Flush remaining audio at the end of a model turn."""
+        self._mark_activity()
+        await playback.flush()
 
-        elif msg.type == "tool_call":
-            logger.info("Tool call: %s(%s)", msg.tool_name, msg.tool_args)
-            result = await self._tool_server.execute_tool(
-                msg.tool_name, msg.tool_args
-            )
-            self._last_activity = time.monotonic()
-            if self._session and self._session.is_connected:
-                await self._session.send_tool_response(msg.tool_call_id, result)
+    async def _on_interrupted(
+        self, msg: ServerMessage, playback: AudioPlaybackStream
+    ) -> None:
+        """Stop playback immediately when the user starts speaking."""
+        playback.stop()
+        self._mark_activity()
 
-        elif msg.type == "setup_complete":
-            logger.info("Gemini setup complete.")
+    async def _on_tool_call(
+        self, msg: ServerMessage, playback: AudioPlaybackStream
+    ) -> None:
+        """Execute a tool call and send the result back to Gemini."""
+        logger.info("Tool call: %s(%s)", msg.tool_name, msg.tool_args)
+        result = await self._tool_server.execute_tool(
+            msg.tool_name, msg.tool_args
+        )
+        self._mark_activity()
+        if self._session and self._session.is_connected:
+            await self._session.send_tool_response(msg.tool_call_id, result)
 
-        elif msg.type == "go_away":
-            logger.warning("Gemini session ending (go_away).")
+    async def _on_setup_complete(
+        self, msg: ServerMessage, playback: AudioPlaybackStream
+    ) -> None:
+        """Log session setup completion."""
+        logger.info("Gemini setup complete.")
 
-        elif msg.type == "error":
-            logger.error("Gemini error: %s", msg.text)
+    async def _on_go_away(
+        self, msg: ServerMessage, playback: AudioPlaybackStream
+    ) -> None:
+        """Log the server-initiated session end."""
+        logger.warning("Gemini session ending (go_away).")
+
+    async def _on_error(
+        self, msg: ServerMessage, playback: AudioPlaybackStream
+    ) -> None:
+        """Log a session error."""
+        logger.error("Gemini error: %s", msg.text)
+
+    def _mark_activity(self) -> None:
+        """Record conversation activity and re-arm the silence timer."""
+        if self._timeout_fired is None:
+            return
+        if self._timeout_handle is not None:
+            self._timeout_handle.cancel()
+        self._timeout_handle = asyncio.get_running_loop().call_later(
+            self._conversation_timeout, self._timeout_fired.set
+        )
 
     async def _timeout_monitor(self) -> None:
-        """Watch for conversation silence timeout."""
-        while self._running and self._state == RobotState.CONVERSATION:
-            await asyncio.sleep(1.0)
-            elapsed = time.monotonic() - self._last_activity
-            if elapsed >= self._conversation_timeout:
-                logger.info(
-                    "Conversation timed out after %.1fs of silence.", elapsed
-                )
-                return
+        """Wait for the conversation silence timeout to fire."""
+        await self._timeout_fired.wait()
+        logger.info(
+            "Conversation timed out after %.1fs of silence.",
+            self._conversation_timeout,
+        )
 
     # ------------------------------------------------------------------
     # Utilities
@@ -312,20 +386,22 @@ class RobotController:
             True if the event was set, False if stop was requested.
         """
         event_task = asyncio.create_task(event.wait())
-        stop_task = asyncio.create_task(self._stop_event.wait())
+        # The stop waiter persists across IDLE cycles; only the per-event
+        # task is created (and cancelled) per call.
+        if self._stop_wait_task is None:
+            self._stop_wait_task = asyncio.create_task(self._stop_event.wait())
 
-        done: Set[asyncio.Task] = set()
-        pending: Set[asyncio.Task] = set()
+        done: set[asyncio.Task] = set()
         try:
-            done, pending = await asyncio.wait(
-                {event_task, stop_task},
+            done, _pending = await asyncio.wait(
+                {event_task, self._stop_wait_task},
                 return_when=asyncio.FIRST_COMPLETED,
             )
         finally:
-            for task in pending:
-                task.cancel()
+            if not event_task.done():
+                event_task.cancel()
                 try:
-                    await task
+                    await event_task
                 except asyncio.CancelledError:
                     pass
 
@@ -333,6 +409,13 @@ class RobotController:
 
     async def _cleanup(self) -> None:
         """Release all resources during shutdown."""
+        if self._stop_wait_task is not None:
+            self._stop_wait_task.cancel()
+            try:
+                await self._stop_wait_task
+            except asyncio.CancelledError:
+                pass
+            self._stop_wait_task = None
         self._wake_detector.stop()
         if self._session and self._session.is_connected:
             await self._session.close()
@@ -6,9 +6,12 @@ for bidirectional audio streaming with Gemini.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import sys
 from dataclasses import dataclass, field
-from typing import AsyncIterator
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Iterator, Mapping, NamedTuple
 
 from google import genai
 from google.genai import types
@@ -16,7 +19,7 @@ from google.genai import types
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GeminiSessionConfig:
     """Configuration for a Gemini Live session.
 
@@ -35,10 +38,18 @@ class GeminiSessionConfig:
     vad_sensitivity: str = "MEDIUM"
 
 
-@dataclass
-class ServerMessage:
+# Immutable empty-mapping sentinel shared by all messages without tool
+# arguments (a NamedTuple default is a single shared object).
+_EMPTY_ARGS: Mapping[str, Any] = MappingProxyType({})
+
+
+class ServerMessage(NamedTuple):
     """Normalized message received from Gemini.
 
+    A NamedTuple rather than a dataclass: messages are created once per
+    Gemini event (audio chunks at 20+ Hz), and tuple construction and
+    field access are markedly cheaper.
+
     Attributes:
         type: Message type — "setup_complete", "audio", "transcription",
               "input_transcription", "tool_call", "turn_complete",
@@ -47,7 +58,8 @@ class ServerMessage:
         text: Transcription text or error message.
         tool_call_id: Function call ID (for type="tool_call").
         tool_name: Function name (for type="tool_call").
-        tool_args: Function arguments (for type="tool_call").
+        tool_args: Function arguments (for type="tool_call"). Read-only;
+            copy before mutating.
     """
 
     type: str
@@ -55,7 +67,120 @@ class ServerMessage:
     text: str = ""
     tool_call_id: str = ""
     tool_name: str = ""
-    tool_args: dict = field(default_factory=dict)
+    tool_args: Mapping[str, Any] = _EMPTY_ARGS
+
+
+# Mime type for outbound microphone PCM (16 kHz, 16-bit, mono).
+_PCM_MIME = "audio/pcm;rate=16000"
+
+# Message-type constants, explicitly interned: every ServerMessage is
+# built from (and dispatched on) one of these, so `msg.type == "audio"`
+# style comparisons take CPython's identity fast path.
+_T_SETUP_COMPLETE = sys.intern("setup_complete")
+_T_AUDIO = sys.intern("audio")
+_T_TRANSCRIPTION = sys.intern("transcription")
+_T_INPUT_TRANSCRIPTION = sys.intern("input_transcription")
+_T_TOOL_CALL = sys.intern("tool_call")
+_T_TURN_COMPLETE = sys.intern("turn_complete")
+_T_INTERRUPTED = sys.intern("interrupted")
+_T_TOOL_CALL_CANCELLATION = sys.intern("tool_call_cancellation")
+_T_GO_AWAY = sys.intern("go_away")
+_T_ERROR = sys.intern("error")
+
+# Bound on chunks queued for the background audio writer; await put()
+# blocks the producer when full, applying backpressure instead of
+# buffering stale microphone audio without limit.
+_AUDIO_QUEUE_MAX = 64
+
+# Payload-free messages are immutable in practice; sharing one instance
+# per type avoids a dataclass construction on every such event.
+_MSG_SETUP_COMPLETE = ServerMessage(type=_T_SETUP_COMPLETE)
+_MSG_INTERRUPTED = ServerMessage(type=_T_INTERRUPTED)
+_MSG_TURN_COMPLETE = ServerMessage(type=_T_TURN_COMPLETE)
+_MSG_GO_AWAY = ServerMessage(type=_T_GO_AWAY)
+
+
+def _parse_setup_complete(value, tool_call_names) -> Iterator[ServerMessage]:
+    yield _MSG_SETUP_COMPLETE
+
+
+def _parse_server_content(sc, tool_call_names) -> Iterator[ServerMessage]:
+    if sc.model_turn and sc.model_turn.parts:
+        # Fuse all audio parts in this SDK message into one ServerMessage,
+        # so downstream sees one queue hop and one write per event rather
+        # than one per part.
+        audio_chunks = []
+        for part in sc.model_turn.parts:
+            if part.inline_data and part.inline_data.data:
+                audio_chunks.append(part.inline_data.data)
+            if part.text:
+                yield ServerMessage(
+                    type=_T_TRANSCRIPTION,
+                    text=part.text,
+                )
+        if audio_chunks:
+            yield ServerMessage(
+                type=_T_AUDIO,
+                audio_data=(
+                    audio_chunks[0]
+                    if len(audio_chunks) == 1
+                    else b"".join(audio_chunks)
+                ),
+            )
+
+    if sc.output_transcription and sc.output_transcription.text:
+        yield ServerMessage(
+            type=_T_TRANSCRIPTION,
+            text=sc.output_transcription.text,
+        )
+
+    if sc.input_transcription and sc.input_transcription.text:
+        yield ServerMessage(
+            type=_T_INPUT_TRANSCRIPTION,
+            text=sc.input_transcription.text,
+        )
+
+    if sc.interrupted:
+        yield _MSG_INTERRUPTED
+
+    if sc.turn_complete:
+        yield _MSG_TURN_COMPLETE
+
+
+def _parse_tool_call(tc, tool_call_names) -> Iterator[ServerMessage]:
+    for fc in tc.function_calls:
+        call_id = fc.id or ""
+        name = fc.name or ""
+        tool_call_names[call_id] = name
+        yield ServerMessage(
+            type=_T_TOOL_CALL,
+            tool_call_id=call_id,
+            tool_name=name,
+            tool_args=fc.args or {},
+        )
+
+
+def _parse_tool_call_cancellation(tcc, tool_call_names) -> Iterator[ServerMessage]:
+    ids = tcc.ids or []
+    yield ServerMessage(
+        type=_T_TOOL_CALL_CANCELLATION,
+        text=",".join(ids),
+    )
+
+
+def _parse_go_away(value, tool_call_names) -> Iterator[ServerMessage]:
+    yield _MSG_GO_AWAY
+
+
+# Dispatch table for _parse_message: one getattr + truthiness check per
+# top-level SDK field, instead of a branch chain re-reading attributes.
+_MESSAGE_PARSERS = (
+    ("setup_complete", _parse_setup_complete),
+    ("server_content", _parse_server_content),
+    ("tool_call", _parse_tool_call),
+    ("tool_call_cancellation", _parse_tool_call_cancellation),
+    ("go_away", _parse_go_away),
+)
 
 
 _VAD_SENSITIVITY_MAP = {
@@ -74,6 +199,50 @@ _VAD_SENSITIVITY_MAP = {
 }
 
 
+def _build_live_config(config: GeminiSessionConfig) -> types.LiveConnectConfig:
+    """Build the LiveConnectConfig for a session configuration.
+
+    Construction runs roughly ten pydantic model validations, so sessions
+    build this once and reuse it across reconnects (see GeminiSession).
+
+    Args:
+        config: Session configuration.
+
+    Returns:
+        Fully populated LiveConnectConfig.
+    """
+    start_sens, end_sens = _VAD_SENSITIVITY_MAP.get(
+        config.vad_sensitivity,
+        _VAD_SENSITIVITY_MAP["MEDIUM"],
+    )
+
+    return types.LiveConnectConfig(
+        response_modalities=["AUDIO"],
+        system_instruction=config.system_prompt,
+        speech_config=types.SpeechConfig(
+            voice_config=types.VoiceConfig(
+                prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                    voice_name=config.voice,
+                )
+            ),
+        ),
+        tools=config.tools if config.tools else None,
+        input_audio_transcription=types.AudioTranscriptionConfig(),
+        output_audio_transcription=types.AudioTranscriptionConfig(),
+        realtime_input_config=types.RealtimeInputConfig(
+            automatic_activity_detection=types.AutomaticActivityDetection(
+                disabled=False,
+                start_of_speech_sensitivity=start_sens,
+                end_of_speech_sensitivity=end_sens,
+            ),
+            activity_handling=types.ActivityHandling.START_OF_ACTIVITY_INTERRUPTS,
+        ),
+        context_window_compression=types.ContextWindowCompressionConfig(
+            sliding_window=types.SlidingWindow(),
+        ),
+    )
+
+
 class GeminiSession:
     """Manages a Gemini Live API WebSocket session.
 
@@ -90,45 +259,24 @@ class GeminiSession:
         self._session_cm = None
         self._connected = False
         self._tool_call_names: dict[str, str] = {}
+        self._live_config: types.LiveConnectConfig | None = None
+        self._audio_q: asyncio.Queue[bytes] = asyncio.Queue(
+            maxsize=_AUDIO_QUEUE_MAX
+        )
+        self._writer_task: asyncio.Task | None = None
 
     async def connect(self) -> None:
         """Open WebSocket connection and send setup message."""
         self._client = genai.Client(api_key=self._api_key)
 
-        start_sens, end_sens = _VAD_SENSITIVITY_MAP.get(
-            self._config.vad_sensitivity,
-            _VAD_SENSITIVITY_MAP["MEDIUM"],
-        )
-
-        live_config = types.LiveConnectConfig(
-            response_modalities=["AUDIO"],
-            system_instruction=self._config.system_prompt,
-            speech_config=types.SpeechConfig(
-                voice_config=types.VoiceConfig(
-                    prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                        voice_name=self._config.voice,
-                    )
-                ),
-            ),
-            tools=self._config.tools if self._config.tools else None,
-            input_audio_transcription=types.AudioTranscriptionConfig(),
-            output_audio_transcription=types.AudioTranscriptionConfig(),
-            realtime_input_config=types.RealtimeInputConfig(
-                automatic_activity_detection=types.AutomaticActivityDetection(
-                    disabled=False,
-                    start_of_speech_sensitivity=start_sens,
-                    end_of_speech_sensitivity=end_sens,
-                ),
-                activity_handling=types.ActivityHandling.START_OF_ACTIVITY_INTERRUPTS,
-            ),
-            context_window_compression=types.ContextWindowCompressionConfig(
-                sliding_window=types.SlidingWindow(),
-            ),
-        )
+        # Session config is fixed for the lifetime of this object, so the
+        # built config is cached and reconnects skip re-validation.
+        if self._live_config is None:
+            self._live_config = _build_live_config(self._config)
 
         self._session_cm = self._client.aio.live.connect(
             model=self._config.model,
-            config=live_config,
+            config=self._live_config,
         )
         self._session = await self._session_cm.__aenter__()
         self._connected = True
@@ -150,9 +298,46 @@ class GeminiSession:
         if not self._connected or self._session is None:
             raise RuntimeError("Gemini session is not connected.")
 
-        await self._session.send_realtime_input(
-            audio=types.Blob(data=chunk, mime_type="audio/pcm;rate=16000"),
-        )
+        # Chunks are queued for a single background writer (started on
+        # the first chunk, like the playback drain task) that coalesces
+        # whatever has accumulated into one websocket send. The bounded
+        # queue blocks here when the writer falls behind.
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._audio_writer())
+        await self._audio_q.put(chunk)
+
+    async def _audio_writer(self) -> None:
+        """Drain queued microphone chunks into websocket sends.
+
+        Coalescing everything queued since the last send amortizes
+        websocket framing and Blob construction across chunks and keeps
+        one await on the scheduler instead of one per chunk.
+        """
+        queue = self._audio_q
+        session = self._session
+        try:
+            while True:
+                chunk = await queue.get()
+                if queue.qsize():
+                    parts = [chunk]
+                    while True:
+                        try:
+                            parts.append(queue.get_nowait())
+                        except asyncio.QueueEmpty:
+                            break
+                    chunk = b"".join(parts)
+                # model_construct skips pydantic validation; the payload
+                # is raw bytes plus a constant mime type, per mic chunk.
+                await session.send_realtime_input(
+                    audio=types.Blob.model_construct(
+                        data=chunk, mime_type=_PCM_MIME
+                    ),
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Audio writer error: %s", e)
+            self._connected = False
 
     async def receive(self) -> AsyncIterator[ServerMessage]:
         """Yield normalized messages from Gemini.
@@ -172,8 +357,11 @@ class GeminiSession:
                     yield server_msg
         except Exception as e:
             logger.error("Error receiving from Gemini: %s", e)
-            yield ServerMessage(type="error", text=str(e))
+            # Mark disconnected before yielding so consumers that react
+            # to the error message (or close the generator) observe a
+            # consistent state.
             self._connected = False
+            yield ServerMessage(type=_T_ERROR, text=str(e))
 
     async def send_tool_response(self, call_id: str, result: dict) -> None:
         """Send the result of a function call back to Gemini.
@@ -202,6 +390,16 @@ class GeminiSession:
 
     async def close(self) -> None:
         """Close the WebSocket session gracefully."""
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+            # Fresh queue so a reconnect does not replay stale audio.
+            self._audio_q = asyncio.Queue(maxsize=_AUDIO_QUEUE_MAX)
+
         if self._session_cm is not None:
             try:
                 await self._session_cm.__aexit__(None, None, None)
@@ -219,74 +417,22 @@ class GeminiSession:
         """Check if the session is currently connected."""
         return self._connected
 
-    def _parse_message(self, message: types.LiveServerMessage) -> list[ServerMessage]:
+    def _parse_message(
+        self, message: types.LiveServerMessage
+    ) -> Iterator[ServerMessage]:
         """Parse a raw SDK message into normalized ServerMessage(s).
 
         Args:
             message: Raw message from the Gemini SDK.
 
-        Returns:
-            List of ServerMessage objects (may be empty or multiple).
+        Yields:
+            ServerMessage objects (possibly none). Lazy: most messages
+            produce exactly one result, and a generator avoids the
+            per-message list allocation.
         """
-        results: list[ServerMessage] = []
-
-        if message.setup_complete:
-            results.append(ServerMessage(type="setup_complete"))
-
-        if message.server_content:
-            sc = message.server_content
-
-            if sc.model_turn and sc.model_turn.parts:
-                for part in sc.model_turn.parts:
-                    if part.inline_data and part.inline_data.data:
-                        results.append(ServerMessage(
-                            type="audio",
-                            audio_data=part.inline_data.data,
-                        ))
-                    if part.text:
-                        results.append(ServerMessage(
-                            type="transcription",
-                            text=part.text,
-                        ))
-
-            if sc.output_transcription and sc.output_transcription.text:
-                results.append(ServerMessage(
-                    type="transcription",
-                    text=sc.output_transcription.text,
-                ))
-
-            if sc.input_transcription and sc.input_transcription.text:
-                results.append(ServerMessage(
-                    type="input_transcription",
-                    text=sc.input_transcription.text,
-                ))
-
-            if sc.interrupted:
-                results.append(ServerMessage(type="interrupted"))
-
-            if sc.turn_complete:
-                results.append(ServerMessage(type="turn_complete"))
-
-        if message.tool_call:
-            for fc in message.tool_call.function_calls:
-                call_id = fc.id or ""
-                name = fc.name or ""
-                self._tool_call_names[call_id] = name
-                results.append(ServerMessage(
-                    type="tool_call",
-                    tool_call_id=call_id,
-                    tool_name=name,
-                    tool_args=fc.args or {},
-                ))
-
-        if message.tool_call_cancellation:
-            ids = message.tool_call_cancellation.ids or []
-            results.append(ServerMessage(
-                type="tool_call_cancellation",
-                text=",".join(ids),
-            ))
-
-        if message.go_away:
-            results.append(ServerMessage(type="go_away"))
-
-        return results
+        tool_call_names = self._tool_call_names
+
+        for attr, parse in _MESSAGE_PARSERS:
+            value = getattr(message, attr)
+            if value:
+                yield from parse(value, tool_call_names)
@@ -3,17 +3,19 @@
 All robot code that touches microphones, speakers, displays, or cameras
 must go through these interfaces. Hardware-specific implementations live
 in src/hardware/impl/ — never import hardware libraries outside of that.
+
+These are plain base classes whose methods raise NotImplementedError
+rather than abc.ABC subclasses: ABCMeta adds metaclass overhead to every
+isinstance check and method resolution, and read_chunk/write_chunk sit
+on the audio hot path. Implementations must override every method.
 """
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-
 
-class AudioInput(ABC):
+class AudioInput:
     """Abstract microphone input."""
 
-    @abstractmethod
     def open_stream(
         self,
         sample_rate: int = 16000,
@@ -27,9 +29,8 @@ class AudioInput(ABC):
             channels: Number of audio channels (1 = mono).
             chunk_size: Number of bytes per chunk.
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def read_chunk(self) -> bytes:
         """Read one chunk of PCM audio data.
 
@@ -39,23 +40,20 @@ class AudioInput(ABC):
         Raises:
             RuntimeError: If the stream is not open.
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def close_stream(self) -> None:
         """Close the audio input stream."""
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def is_open(self) -> bool:
         """Check if the stream is currently open."""
-        ...
+        raise NotImplementedError
 
 
-class AudioOutput(ABC):
+class AudioOutput:
     """Abstract speaker output."""
 
-    @abstractmethod
     def open_stream(self, sample_rate: int = 24000, channels: int = 1) -> None:
         """Open the audio output stream.
 
@@ -63,67 +61,63 @@ class AudioOutput(ABC):
             sample_rate: Sample rate in Hz.
             channels: Number of audio channels (1 = mono).
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def write_chunk(self, data: bytes) -> None:
         """Write one chunk of PCM audio data to the speaker.
 
+        Implementations must consume (copy or play) the data before
+        returning; callers may pass any bytes-like object and reuse
+        the underlying buffer afterwards.
+
         Args:
             data: Raw PCM audio bytes (16-bit little-endian).
 
         Raises:
             RuntimeError: If the stream is not open.
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def close_stream(self) -> None:
         """Close the audio output stream."""
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def stop(self) -> None:
         """Immediately stop playback and close the stream."""
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def is_open(self) -> bool:
         """Check if the stream is currently open."""
-        ...
+        raise NotImplementedError
 
 
-class DisplayOutput(ABC):
+class DisplayOutput:
     """Abstract display/screen output."""
 
-    @abstractmethod
     def show_text(self, text: str) -> None:
         """Display text on the screen.
 
         Args:
             text: Text content to display.
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def show_status(self, status: str) -> None:
         """Display a status indicator.
 
         Args:
             status: Status string (e.g., "listening", "thinking").
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def clear(self) -> None:
         """Clear the display."""
-        ...
+        raise NotImplementedError
 
 
-class CameraInput(ABC):
+class CameraInput:
     """Abstract camera input."""
 
-    @abstractmethod
     def capture_frame(self) -> bytes:
         """Capture a single frame as JPEG bytes.
 
@@ -133,9 +127,8 @@ class CameraInput(ABC):
         Raises:
             RuntimeError: If the camera is not available.
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def is_available(self) -> bool:
         """Check if camera hardware is available."""
-        ...
+        raise NotImplementedError
@@ -9,12 +9,95 @@ These stubs enable development and testing without real hardware:
 
 from __future__ import annotations
 
+import functools
 import struct
 import wave
 from pathlib import Path
 
 from src.hardware.interfaces import AudioInput, AudioOutput, CameraInput, DisplayOutput
 
+# Canonical 44-byte header of a PCM WAV file: RIFF + fmt + data chunks.
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _wav_header(sample_rate: int, channels: int, data_size: int) -> bytes:
+    """Pack a canonical WAV header for 16-bit PCM audio.
+
+    Args:
+        sample_rate: Sample rate in Hz.
+        channels: Number of audio channels.
+        data_size: Size of the PCM payload in bytes.
+
+    Returns:
+        The 44-byte RIFF/fmt/data header.
+    """
+    block_align = channels * 2
+    return _WAV_HEADER.pack(
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM format tag
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        16,  # bits per sample
+        b"data",
+        data_size,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_wav_pcm(path: str, mtime: float) -> bytes:
+    """Load and cache a WAV file's PCM payload.
+
+    Keyed on (path, mtime) so a rewritten file is re-read while repeated
+    open_stream calls on the same file skip the parse and disk I/O.
+
+    Canonically laid out files (the 44-byte RIFF/fmt/data header this
+    module also writes) are sliced directly after one struct unpack;
+    anything else falls back to the wave module's chunk walk.
+
+    Args:
+        path: Path to a WAV file.
+        mtime: The file's modification time (cache-invalidation key).
+
+    Returns:
+        Raw PCM bytes from the file.
+    """
+    raw = Path(path).read_bytes()
+    if len(raw) >= _WAV_HEADER.size:
+        (
+            riff_id,
+            _riff_size,
+            wave_id,
+            fmt_id,
+            fmt_size,
+            fmt_tag,
+            _channels,
+            _rate,
+            _byte_rate,
+            _block_align,
+            bits,
+            data_id,
+            data_size,
+        ) = _WAV_HEADER.unpack_from(raw)
+        if (
+            riff_id == b"RIFF"
+            and wave_id == b"WAVE"
+            and fmt_id == b"fmt "
+            and fmt_size == 16
+            and fmt_tag == 1  # uncompressed PCM
+            and bits == 16
+            and data_id == b"data"
+        ):
+            return raw[_WAV_HEADER.size : _WAV_HEADER.size + data_size]
+
+    with wave.open(path, "rb") as wf:
+        return wf.readframes(wf.getnframes())
+
 
 class StubAudioInput(AudioInput):
     """Reads PCM audio from a WAV file, looping if necessary.
@@ -31,6 +114,8 @@ class StubAudioInput(AudioInput):
         self._chunk_size = 1024
         self._wav_file: wave.Wave_read | None = None
         self._pcm_data: bytes = b""
+        self._view: memoryview = memoryview(b"")
+        self._silence: bytes | None = None
         self._read_pos = 0
 
     def open_stream(
@@ -46,14 +131,18 @@ class StubAudioInput(AudioInput):
         self._read_pos = 0
 
         if self._wav_path and self._wav_path.exists():
-            wf = wave.open(str(self._wav_path), "rb")
-            self._pcm_data = wf.readframes(wf.getnframes())
-            wf.close()
+            self._silence = None
+            self._pcm_data = _load_wav_pcm(
+                str(self._wav_path), self._wav_path.stat().st_mtime
+            )
+            # Duplicate the first chunk at the tail so a wrapping read is
+            # still one contiguous slice — no concatenation branch needed.
+            self._view = memoryview(self._pcm_data + self._pcm_data[:chunk_size])
         else:
-            # Generate 1 second of silence
-            num_samples = sample_rate
-            self._pcm_data = struct.pack(f"<{num_samples}h", *([0] * num_samples))
-
+            # Silence is position-independent: allocate one immutable
+            # zero chunk and hand it back on every read, instead of
+            # slicing fresh copies from a 1-second PCM buffer.
+            self._silence = bytes(chunk_size)
         self._stream_open = True
 
     def read_chunk(self) -> bytes:
@@ -61,18 +150,12 @@ class StubAudioInput(AudioInput):
         if not self._stream_open:
             raise RuntimeError("Audio input stream is not open.")
 
-        end = self._read_pos + self._chunk_size
-        if end <= len(self._pcm_data):
-            chunk = self._pcm_data[self._read_pos:end]
-        else:
-            # Wrap around
-            chunk = self._pcm_data[self._read_pos:]
-            remaining = self._chunk_size - len(chunk)
-            self._read_pos = 0
-            chunk += self._pcm_data[:remaining]
-            end = remaining
-
-        self._read_pos = end
+        if self._silence is not None:
+            return self._silence
+
+        start = self._read_pos
+        chunk = bytes(self._view[start:start + self._chunk_size])
+        self._read_pos = (start + self._chunk_size) % len(self._pcm_data)
         return chunk
 
     def close_stream(self) -> None:
@@ -97,24 +180,28 @@ class StubAudioOutput(AudioOutput):
         self._stream_open = False
         self._sample_rate = 24000
         self._channels = 1
-        self._chunks: list[bytes] = []
+        self._buffer = bytearray()
 
     def open_stream(self, sample_rate: int = 24000, channels: int = 1) -> None:
         """Open the audio output stream."""
         self._sample_rate = sample_rate
         self._channels = channels
-        self._chunks = []
+        self._buffer = bytearray()
         self._stream_open = True
 
     def write_chunk(self, data: bytes) -> None:
-        """Write one chunk of PCM audio data."""
+        """Write one chunk of PCM audio data.
+
+        Copies the data before returning — callers may reuse the buffer
+        afterwards, matching real audio device semantics.
+        """
         if not self._stream_open:
             raise RuntimeError("Audio output stream is not open.")
-        self._chunks.append(data)
+        self._buffer += data
 
     def close_stream(self) -> None:
         """Close the stream and write to file if configured."""
-        if self._stream_open and self._output_path and self._chunks:
+        if self._stream_open and self._output_path and self._buffer:
             self._write_wav()
         self._stream_open = False
 
@@ -132,16 +219,20 @@ class StubAudioOutput(AudioOutput):
         Returns:
             Concatenated PCM bytes from all written chunks.
         """
-        return b"".join(self._chunks)
+        return bytes(self._buffer)
 
     def _write_wav(self) -> None:
-        """Write accumulated chunks to a WAV file."""
-        pcm_data = b"".join(self._chunks)
-        with wave.open(str(self._output_path), "wb") as wf:
-            wf.setnchannels(self._channels)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(self._sample_rate)
-            wf.writeframes(pcm_data)
+        """Write the accumulated PCM buffer to a WAV file.
+
+        The payload size is known up front (the audio is buffered), so
+        the header is packed directly and the file is written in one
+        sequential pass — no wave-module chunk machinery or seek-back
+        header patching.
+        """
+        header = _wav_header(self._sample_rate, self._channels, len(self._buffer))
+        with open(self._output_path, "wb") as f:
+            f.write(header)
+            f.write(self._buffer)
 
 
 class StubDisplayOutput(DisplayOutput):
@@ -171,6 +262,11 @@ class StubDisplayOutput(DisplayOutput):
         print("[DISPLAY] <cleared>")
 
 
+# Minimal JPEG placeholder: just SOI + EOI markers.
+# Real implementations return actual camera frames.
+_PLACEHOLDER_JPEG = b"\xff\xd8\xff\xd9"
+
+
 class StubCameraInput(CameraInput):
     """Returns a static test JPEG image.
 
@@ -180,15 +276,16 @@ class StubCameraInput(CameraInput):
 
     def __init__(self, image_path: Path | None = None) -> None:
         self._image_path = image_path
+        # The image is static; read it once and share the immutable
+        # bytes across captures instead of hitting disk per frame.
+        if image_path and image_path.exists():
+            self._frame = image_path.read_bytes()
+        else:
+            self._frame = _PLACEHOLDER_JPEG
 
     def capture_frame(self) -> bytes:
         """Capture a single frame as JPEG bytes."""
-        if self._image_path and self._image_path.exists():
-            return self._image_path.read_bytes()
-
-        # Return minimal JPEG: just SOI + EOI markers as a placeholder
-        # Real implementations return actual camera frames
-        return b"\xff\xd8\xff\xd9"
+        return self._frame
 
     def is_available(self) -> bool:
         """Check if camera hardware is available."""
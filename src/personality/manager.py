@@ -6,18 +6,33 @@ validates them against the voice catalog, and provides lookup.
 
 from __future__ import annotations
 
-import json
+import functools
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from src.personality.voices import get_voice
+from src.personality.voices import VOICE_CATALOG
 
+try:
+    # Rust JSON parser — markedly faster than the stdlib on the
+    # multi-KB prompt files loaded at startup.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
-_VALID_VAD_SENSITIVITIES = {"LOW", "MEDIUM", "HIGH"}
 
+_REQUIRED_FIELDS = ("name", "voice", "system_prompt")
+_VALID_VAD_SENSITIVITIES = frozenset({"LOW", "MEDIUM", "HIGH"})
 
-@dataclass(frozen=True)
+# Case-insensitive voice existence check — a set probe instead of a
+# get_voice call that raises (and formats the full catalog) on miss.
+_VOICE_NAMES_LOWER = frozenset(name.lower() for name in VOICE_CATALOG)
+
+
+@dataclass(frozen=True, slots=True)
 class PersonalityConfig:
     """Configuration for a robot personality.
 
@@ -38,6 +53,12 @@ class PersonalityConfig:
     vad_sensitivity: str
 
 
+# Validated configs keyed by (path, mtime_ns). PersonalityConfig is
+# frozen, so constructing another manager over the same unchanged files
+# can share the instances and skip the read/parse/validate work.
+_CONFIG_CACHE: dict[tuple[str, int], PersonalityConfig] = {}
+
+
 def _validate_personality(data: dict[str, Any], source: str) -> PersonalityConfig:
     """Validate and create a PersonalityConfig from raw JSON data.
 
@@ -51,24 +72,22 @@ def _validate_personality(data: dict[str, Any], source: str) -> PersonalityConfi
     Raises:
         ValueError: If required fields are missing or invalid.
     """
-    required_fields = ["name", "voice", "system_prompt"]
-    for field in required_fields:
+    for field in _REQUIRED_FIELDS:
         if field not in data:
             raise ValueError(f"Personality '{source}' missing required field: {field}")
 
     voice_name = data["voice"]
-    try:
-        get_voice(voice_name)
-    except KeyError as e:
+    if voice_name.lower() not in _VOICE_NAMES_LOWER:
         raise ValueError(
-            f"Personality '{source}' uses unknown voice '{voice_name}': {e}"
-        ) from e
+            f"Personality '{source}' uses unknown voice '{voice_name}'. "
+            f"Available voices: {', '.join(VOICE_CATALOG.keys())}"
+        )
 
     vad = data.get("vad_sensitivity", "MEDIUM").upper()
     if vad not in _VALID_VAD_SENSITIVITIES:
         raise ValueError(
             f"Personality '{source}' has invalid vad_sensitivity '{vad}'. "
-            f"Must be one of: {_VALID_VAD_SENSITIVITIES}"
+            f"Must be one of: {', '.join(sorted(_VALID_VAD_SENSITIVITIES))}"
         )
 
     return PersonalityConfig(
@@ -92,22 +111,70 @@ class PersonalityManager:
         self._dir = Path(personalities_dir)
         self._personalities: dict[str, PersonalityConfig] = {}
         self._load_all()
+        # The set of personalities is fixed after loading; precompute the
+        # sorted names and the error-message listing once.
+        self._names: tuple[str, ...] = tuple(sorted(self._personalities))
+        self._names_csv: str = ", ".join(self._names)
+
+    @staticmethod
+    def _read_one(json_file: Path) -> Any:
+        """Read and parse one personality file, returning the error on failure."""
+        try:
+            return _json_loads(json_file.read_bytes())
+        except ValueError as e:
+            # JSONDecodeError (stdlib and orjson) subclasses ValueError.
+            return e
 
     def _load_all(self) -> None:
         """Load all personality JSON files from the directory."""
-        if not self._dir.exists():
+        # One scandir pass replaces the glob plus a stat call per file:
+        # each entry carries its stat result, which also supplies the
+        # mtime component of the cache key.
+        try:
+            with os.scandir(self._dir) as it:
+                entries = sorted(
+                    (e for e in it if e.name.endswith(".json") and e.is_file()),
+                    key=lambda e: e.name,
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        if not entries:
             return
 
-        for json_file in sorted(self._dir.glob("*.json")):
-            try:
-                with open(json_file) as f:
-                    data = json.load(f)
-                personality = _validate_personality(data, str(json_file))
-                key = json_file.stem.lower()
-                self._personalities[key] = personality
-            except (json.JSONDecodeError, ValueError) as e:
-                # Log and skip invalid files rather than crashing
-                print(f"Warning: Skipping invalid personality file {json_file}: {e}")
+        files = [Path(entry.path) for entry in entries]
+        cache_keys = [
+            (entry.path, entry.stat().st_mtime_ns) for entry in entries
+        ]
+        to_read = [
+            f for f, key in zip(files, cache_keys) if key not in _CONFIG_CACHE
+        ]
+
+        # Overlap the file reads and parses; on SD-card-backed storage
+        # the open latency dominates. Validation and insertion stay
+        # sequential so the resulting dict is deterministic.
+        loaded: dict[Path, Any] = {}
+        if to_read:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                loaded = dict(zip(to_read, executor.map(self._read_one, to_read)))
+
+        for json_file, cache_key in zip(files, cache_keys):
+            personality = _CONFIG_CACHE.get(cache_key)
+            if personality is None:
+                data = loaded[json_file]
+                try:
+                    if isinstance(data, ValueError):
+                        raise data
+                    personality = _validate_personality(data, str(json_file))
+                except ValueError as e:
+                    # Log and skip invalid files rather than crashing
+                    print(
+                        f"Warning: Skipping invalid personality file {json_file}: {e}"
+                    )
+                    continue
+                _CONFIG_CACHE[cache_key] = personality
+            # Interned keys make the lookup in get_personality an
+            # identity hit instead of a character compare.
+            self._personalities[sys.intern(json_file.stem.lower())] = personality
 
     def get_personality(self, name: str) -> PersonalityConfig:
         """Get a personality by name (case-insensitive, matches filename stem).
@@ -121,11 +188,10 @@ class PersonalityManager:
         Raises:
             KeyError: If the personality is not found.
         """
-        key = name.lower()
+        key = sys.intern(name.lower())
         if key not in self._personalities:
-            available = ", ".join(self._personalities.keys())
             raise KeyError(
-                f"Personality '{name}' not found. Available: {available}"
+                f"Personality '{name}' not found. Available: {self._names_csv}"
             )
         return self._personalities[key]
 
@@ -135,7 +201,7 @@ class PersonalityManager:
         Returns:
             Sorted list of personality names (filename stems).
         """
-        return sorted(self._personalities.keys())
+        return list(self._names)
 
     def get_default(self) -> PersonalityConfig:
         """Get the default personality ('friendly').
@@ -147,3 +213,19 @@ class PersonalityManager:
             KeyError: If the 'friendly' personality is not loaded.
         """
         return self.get_personality("friendly")
+
+
+@functools.lru_cache(maxsize=4)
+def get_manager(personalities_dir: str) -> PersonalityManager:
+    """Return a shared PersonalityManager for a directory.
+
+    The manager is read-only after loading, so repeat callers for the
+    same directory share one instance instead of re-scanning it.
+
+    Args:
+        personalities_dir: Path to directory containing personality JSON files.
+
+    Returns:
+        The cached (or newly loaded) manager for that directory.
+    """
+    return PersonalityManager(personalities_dir)
@@ -7,9 +7,11 @@ Voice names are passed to Gemini's voiceConfig in the WebSocket setup.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VoiceInfo:
     """Information about a Gemini voice.
 
@@ -24,7 +26,9 @@ class VoiceInfo:
     personality_fit: str
 
 
-VOICE_CATALOG: dict[str, VoiceInfo] = {
+# Read-only view — the catalog is fixed at import time, and the proxy
+# keeps callers from mutating it by accident.
+VOICE_CATALOG: Mapping[str, VoiceInfo] = MappingProxyType({
     "Achird": VoiceInfo("Achird", "Friendly", "Default warm assistant"),
     "Sulafat": VoiceInfo("Sulafat", "Warm", "Caring, empathetic"),
     "Puck": VoiceInfo("Puck", "Upbeat", "Energetic, fun"),
@@ -55,6 +59,13 @@ VOICE_CATALOG: dict[str, VoiceInfo] = {
     "Autonoe": VoiceInfo("Autonoe", "Bright", "Vivid, engaging"),
     "Orus": VoiceInfo("Orus", "Firm", "Strong, decisive"),
     "Schedar": VoiceInfo("Schedar", "Even", "Balanced, steady"),
+})
+
+
+# Case-folded index so case-insensitive lookups are a single dict probe
+# instead of a scan over the whole catalog.
+_VOICE_CATALOG_FOLDED: dict[str, VoiceInfo] = {
+    key.casefold(): voice for key, voice in VOICE_CATALOG.items()
 }
 
 
@@ -71,17 +82,12 @@ def get_voice(name: str) -> VoiceInfo:
         KeyError: If the voice name is not found in the catalog.
     """
     # Try exact match first, then case-insensitive
-    if name in VOICE_CATALOG:
-        return VOICE_CATALOG[name]
-
-    name_lower = name.lower()
-    for key, voice in VOICE_CATALOG.items():
-        if key.lower() == name_lower:
-            return voice
-
-    raise KeyError(
-        f"Voice '{name}' not found. Available voices: {', '.join(VOICE_CATALOG.keys())}"
-    )
+    voice = VOICE_CATALOG.get(name) or _VOICE_CATALOG_FOLDED.get(name.casefold())
+    if voice is None:
+        raise KeyError(
+            f"Voice '{name}' not found. Available voices: {', '.join(VOICE_CATALOG.keys())}"
+        )
+    return voice
 
 
 def list_voices() -> list[VoiceInfo]:
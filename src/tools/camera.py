@@ -6,11 +6,19 @@ for Gemini to analyze during conversation.
 
 from __future__ import annotations
 
-import base64
-
 from src.hardware.interfaces import CameraInput
 from src.tools.server import ToolDefinition
 
+try:
+    # SIMD-accelerated base64; several times faster than the stdlib on
+    # the multi-hundred-KB JPEGs a real camera produces.
+    from pybase64 import b64encode_as_string as _b64encode_as_string
+except ImportError:
+    import base64
+
+    def _b64encode_as_string(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
+
 
 def create_camera_tools(camera: CameraInput) -> list[ToolDefinition]:
     """Create camera tool definitions bound to a CameraInput instance.
@@ -25,7 +33,7 @@ def create_camera_tools(camera: CameraInput) -> list[ToolDefinition]:
     def capture_camera_frame() -> dict[str, object]:
         frame_bytes = camera.capture_frame()
         return {
-            "image": base64.b64encode(frame_bytes).decode("ascii"),
+            "image": _b64encode_as_string(frame_bytes),
             "mime_type": "image/jpeg",
             "size_bytes": len(frame_bytes),
         }
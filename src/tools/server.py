@@ -7,8 +7,11 @@ tool calls received during conversation.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import inspect
 import logging
+import py_compile
 from dataclasses import dataclass, field
 from importlib import util as importlib_util
 from pathlib import Path
@@ -18,6 +21,12 @@ from src.hardware.interfaces import CameraInput, DisplayOutput
 
 logger = logging.getLogger(__name__)
 
+# Discovered tool lists keyed by source-content digest, shared across
+# ToolServer instances. The per-instance mtime cache cannot help a
+# freshly constructed server; identical module content (regardless of
+# path) skips the compile+exec that dominates discovery cost.
+_DISCOVERY_CACHE: dict[bytes, list["ToolDefinition"]] = {}
+
 
 @dataclass(frozen=True)
 class ToolParam:
@@ -32,6 +41,11 @@ class ToolParam:
     type: str
     description: str
     required: bool = True
+    # Gemini declaration form of `type`, computed once (frozen dataclass).
+    _type_upper: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_type_upper", self.type.upper())
 
 
 @dataclass
@@ -43,12 +57,19 @@ class ToolDefinition:
         description: Human-readable description shown to the model.
         parameters: Parameter definitions keyed by name.
         handler: Callable that executes the tool logic.
+        is_coroutine: Whether handler is an async function. Classified
+            once here so execute_tool skips the inspect call per
+            invocation.
     """
 
     name: str
     description: str
     parameters: dict[str, ToolParam] = field(default_factory=dict)
     handler: Callable[..., Any] = field(default=lambda: {})
+    is_coroutine: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        self.is_coroutine = inspect.iscoroutinefunction(self.handler)
 
 
 class ToolServer:
@@ -60,6 +81,13 @@ class ToolServer:
 
     def __init__(self) -> None:
         self._tools: dict[str, ToolDefinition] = {}
+        # Dispatch table for execute_tool: name -> (handler, is_coroutine),
+        # one dict probe per invocation with no dataclass attribute reads.
+        self._handlers: dict[str, tuple[Callable[..., Any], bool]] = {}
+        self._decls_cache: list[dict] | None = None
+        # Discovered user-tool modules keyed by path; unchanged files
+        # (same st_mtime_ns) skip re-compilation on later discovery runs.
+        self._user_tool_cache: dict[str, tuple[int, list[ToolDefinition]]] = {}
 
     def register_tool(self, tool: ToolDefinition) -> None:
         """Register a single tool.
@@ -68,6 +96,8 @@ class ToolServer:
             tool: Tool definition to register.
         """
         self._tools[tool.name] = tool
+        self._handlers[tool.name] = (tool.handler, tool.is_coroutine)
+        self._decls_cache = None
         logger.info("Registered tool: %s", tool.name)
 
     def register_builtin_tools(
@@ -111,21 +141,41 @@ class ToolServer:
             if py_file.name.startswith("_"):
                 continue
             try:
-                spec = importlib_util.spec_from_file_location(
-                    f"user_tools.{py_file.stem}", py_file
+                key = str(py_file)
+                mtime_ns = py_file.stat().st_mtime_ns
+                cached = self._user_tool_cache.get(key)
+                if cached is not None and cached[0] == mtime_ns:
+                    tools_list = cached[1]
+                else:
+                    digest = hashlib.blake2b(
+                        py_file.read_bytes(), digest_size=16
+                    ).digest()
+                    tools_list = _DISCOVERY_CACHE.get(digest)
+                    if tools_list is None:
+                        tools_list = []
+                        spec = importlib_util.spec_from_file_location(
+                            f"user_tools.{py_file.stem}", py_file
+                        )
+                        if spec and spec.loader:
+                            module = importlib_util.module_from_spec(spec)
+                            spec.loader.exec_module(module)
+                            tools_list = [
+                                tool
+                                for tool in getattr(module, "TOOLS", [])
+                                if isinstance(tool, ToolDefinition)
+                            ]
+                            # Populate __pycache__ so later process
+                            # startups load bytecode instead of
+                            # re-parsing the source.
+                            py_compile.compile(key, doraise=False)
+                            _DISCOVERY_CACHE[digest] = tools_list
+                    self._user_tool_cache[key] = (mtime_ns, tools_list)
+
+                for tool in tools_list:
+                    self.register_tool(tool)
+                logger.info(
+                    "Loaded %d tool(s) from %s", len(tools_list), py_file.name
                 )
-                if spec and spec.loader:
-                    module = importlib_util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    tools_list = getattr(module, "TOOLS", [])
-                    count = 0
-                    for tool in tools_list:
-                        if isinstance(tool, ToolDefinition):
-                            self.register_tool(tool)
-                            count += 1
-                    logger.info(
-                        "Loaded %d tool(s) from %s", count, py_file.name
-                    )
             except Exception as e:
                 logger.warning(
                     "Failed to load user tools from %s: %s", py_file.name, e
@@ -136,10 +186,13 @@ class ToolServer:
 
         Returns:
             A list containing one tool dict with all function declarations,
-            or None if no tools are registered.
+            or None if no tools are registered. The result is cached until
+            the next register_tool call.
         """
         if not self._tools:
             return None
+        if self._decls_cache is not None:
+            return self._decls_cache
 
         declarations = []
         for tool in self._tools.values():
@@ -149,15 +202,18 @@ class ToolServer:
             }
 
             if tool.parameters:
-                properties: dict[str, dict[str, str]] = {}
-                required: list[str] = []
-                for param_name, param in tool.parameters.items():
-                    properties[param_name] = {
-                        "type": param.type.upper(),
+                # Snapshot once — both comprehensions walk the same view.
+                items = tuple(tool.parameters.items())
+                properties = {
+                    param_name: {
+                        "type": param._type_upper,
                         "description": param.description,
                     }
-                    if param.required:
-                        required.append(param_name)
+                    for param_name, param in items
+                }
+                required = [
+                    param_name for param_name, param in items if param.required
+                ]
                 decl["parameters"] = {
                     "type": "OBJECT",
                     "properties": properties,
@@ -166,7 +222,8 @@ class ToolServer:
 
             declarations.append(decl)
 
-        return [{"function_declarations": declarations}]
+        self._decls_cache = [{"function_declarations": declarations}]
+        return self._decls_cache
 
     async def execute_tool(self, name: str, args: dict[str, Any]) -> dict[str, Any]:
         """Execute a registered tool by name.
@@ -178,14 +235,20 @@ class ToolServer:
         Returns:
             Result dictionary from the tool, or an error dict on failure.
         """
-        tool = self._tools.get(name)
-        if not tool:
+        entry = self._handlers.get(name)
+        if entry is None:
             return {"error": f"Unknown tool: {name}"}
+        handler, is_coroutine = entry
 
         try:
-            result = tool.handler(**args)
-            if inspect.isawaitable(result):
-                result = await result
+            if is_coroutine:
+                result = await handler(**args)
+            else:
+                # Sync handlers run in a worker thread so blocking
+                # CPU/IO work cannot stall audio playback on the loop.
+                result = await asyncio.to_thread(handler, **args)
+                if inspect.isawaitable(result):
+                    result = await result
             if not isinstance(result, dict):
                 result = {"result": str(result)}
             return result
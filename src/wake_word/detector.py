@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Awaitable, Callable
 
 import numpy as np
@@ -24,7 +25,8 @@ logger = logging.getLogger(__name__)
 
 # OpenWakeWord processes audio in 1280-sample frames (80ms at 16kHz).
 # Each sample is 2 bytes (int16), so 1280 samples = 2560 bytes.
-_OWW_FRAME_BYTES = 1280 * 2
+_OWW_FRAME_SAMPLES = 1280
+_OWW_FRAME_BYTES = _OWW_FRAME_SAMPLES * 2
 
 
 class WakeWordDetector:
@@ -49,6 +51,18 @@ class WakeWordDetector:
         self._paused = False
         self._task: asyncio.Task | None = None
         self._model: OWWModel | None = None
+        # Dedicated single worker: audio reads and predict calls skip the
+        # shared default pool's queueing and keep the model's internal
+        # state on one thread across consecutive calls.
+        self._executor: ThreadPoolExecutor | None = None
+        # Reused destination for each 80 ms frame; steady-state detection
+        # allocates no new ndarrays. The array is a writable int16 view
+        # over a bytearray, so refilling it is a plain byte copy with no
+        # per-frame frombuffer call. _frame_batch1 is a (1, 1280) view of
+        # the same storage for the common single-frame case.
+        self._frame_bytes = bytearray(_OWW_FRAME_BYTES)
+        self._frame_i16 = np.frombuffer(self._frame_bytes, dtype=np.int16)
+        self._frame_batch1 = self._frame_i16.reshape(1, _OWW_FRAME_SAMPLES)
 
     async def start(self, on_detected: Callable[[], Awaitable[None]]) -> None:
         """Begin listening for the wake word.
@@ -63,6 +77,10 @@ class WakeWordDetector:
             return
 
         self._model = OWWModel(wakeword_models=[self._wake_word])
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="oww"
+            )
 
         if not self._audio_input.is_open():
             self._audio_input.open_stream(
@@ -85,6 +103,9 @@ class WakeWordDetector:
             self._task = None
         if self._audio_input.is_open():
             self._audio_input.close_stream()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         self._model = None
         logger.info("Wake word detector stopped.")
 
@@ -107,50 +128,97 @@ class WakeWordDetector:
         """Check if the detector is actively listening (not paused)."""
         return self._listening and not self._paused
 
+    def _predict_frames(self, frames: np.ndarray) -> dict[str, float]:
+        """Run the model over a batch of frames in one executor hop.
+
+        Args:
+            frames: Array of shape (n_frames, 1280), dtype int16.
+
+        Returns:
+            Maximum score per model across the batch.
+        """
+        predict = self._model.predict
+        scores: dict[str, float] = {}
+        for frame in frames:
+            for model_name, score in predict(frame).items():
+                if score > scores.get(model_name, -1.0):
+                    scores[model_name] = score
+        return scores
+
     async def _detection_loop(
         self, on_detected: Callable[[], Awaitable[None]]
     ) -> None:
         """Main detection loop — reads audio, feeds to OWW, fires callback."""
-        loop = asyncio.get_event_loop()
-        audio_buffer = b""
+        loop = asyncio.get_running_loop()
+        # Bind lookups once — this loop runs for every audio chunk.
+        submit = loop.run_in_executor
+        executor = self._executor
+        read_chunk = self._audio_input.read_chunk
+        predict_frames = self._predict_frames
+        # Captured once: at INFO and above the loop skips debug-record
+        # construction entirely rather than paying the level check (and
+        # format-arg computation) on every chunk.
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        # Amortized-growth accumulator: extend() appends in place and
+        # del from the front is a memmove, instead of reallocating and
+        # copying the whole pending buffer per chunk as bytes += did.
+        audio_buffer = bytearray()
 
         try:
             while self._listening:
-                chunk = await loop.run_in_executor(
-                    None, self._audio_input.read_chunk
-                )
+                chunk = await submit(executor, read_chunk)
 
                 if self._paused:
                     await asyncio.sleep(0.01)
                     continue
 
                 # Accumulate audio until we have enough for an OWW frame
-                audio_buffer += chunk
-                if len(audio_buffer) < _OWW_FRAME_BYTES:
+                audio_buffer.extend(chunk)
+                n_frames = len(audio_buffer) // _OWW_FRAME_BYTES
+                if not n_frames:
                     continue
 
-                # Extract one frame and keep remainder
-                frame_data = audio_buffer[:_OWW_FRAME_BYTES]
-                audio_buffer = audio_buffer[_OWW_FRAME_BYTES:]
-
-                audio_array = np.frombuffer(frame_data, dtype=np.int16)
-
-                predictions = await loop.run_in_executor(
-                    None, self._model.predict, audio_array
+                # Extract every complete frame and submit them as one
+                # batch — one executor round-trip instead of one per
+                # frame when reads outpace the 80 ms cadence. The
+                # frombuffer temporaries are released at the end of each
+                # statement, so the front deletion is legal.
+                if n_frames == 1:
+                    self._frame_bytes[:] = memoryview(
+                        audio_buffer
+                    )[:_OWW_FRAME_BYTES]
+                    frames = self._frame_batch1
+                else:
+                    frames = np.frombuffer(
+                        audio_buffer,
+                        dtype=np.int16,
+                        count=n_frames * _OWW_FRAME_SAMPLES,
+                    ).reshape(n_frames, _OWW_FRAME_SAMPLES).copy()
+                del audio_buffer[:n_frames * _OWW_FRAME_BYTES]
+
+                predictions = await submit(executor, predict_frames, frames)
+
+                if debug_enabled:
+                    logger.debug("Wake word scores: %s", predictions)
+
+                hit = next(
+                    (
+                        (model_name, score)
+                        for model_name, score in predictions.items()
+                        if score >= self._sensitivity
+                    ),
+                    None,
                 )
-
-                for model_name, score in predictions.items():
-                    if score >= self._sensitivity:
-                        logger.info(
-                            "Wake word detected! model=%s score=%.4f",
-                            model_name,
-                            score,
-                        )
-                        await on_detected()
-                        # Reset after detection to prevent rapid re-triggers
-                        self._model.reset()
-                        audio_buffer = b""
-                        break
+                if hit is not None:
+                    logger.info(
+                        "Wake word detected! model=%s score=%.4f",
+                        hit[0],
+                        hit[1],
+                    )
+                    await on_detected()
+                    # Reset after detection to prevent rapid re-triggers
+                    self._model.reset()
+                    audio_buffer.clear()
         except asyncio.CancelledError:
             raise
         except Exception as e:
@@ -0,0 +1,68 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from src.core.config import Settings
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PERSONALITIES_DIR = PROJECT_ROOT / "config" / "personalities"
+
+_SETTINGS_DEFAULTS = dict(
+    gemini_api_key="test-key",
+    gemini_model="test-model",
+    input_sample_rate=16000,
+    output_sample_rate=24000,
+    input_channels=1,
+    audio_chunk_size=1024,
+    wake_word="hey_jarvis",
+    wake_word_sensitivity=0.5,
+    default_personality="friendly",
+    personalities_dir=str(PERSONALITIES_DIR),
+    conversation_timeout=30,
+    max_session_duration=600,
+    n8n_server_url="",
+    n8n_api_key="",
+    log_level="INFO",
+)
+
+
+def pytest_asyncio_loop_factories(config: object, item: object) -> dict:
+    """Run the session-scoped test loop on uvloop when it is installed.
+
+    Falls back to the stdlib loop where uvloop is not available
+    (Windows, or environments without the optional dependency).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def base_settings() -> Settings:
+    """One Settings instance shared by the whole run (it is frozen)."""
+    return Settings(**_SETTINGS_DEFAULTS)
+
+
+@pytest.fixture(scope="session")
+def make_settings(base_settings: Settings) -> Callable[..., Settings]:
+    """Factory producing Settings with per-test overrides.
+
+    Tests without overrides get the shared instance back; overrides copy
+    only the changed fields instead of rebuilding from all defaults.
+    """
+
+    def _make(**overrides: object) -> Settings:
+        if not overrides:
+            return base_settings
+        return dataclasses.replace(base_settings, **overrides)
+
+    return _make
@@ -54,8 +54,12 @@ class TestAudioCaptureStream:
         await stream.stop()
 
         assert session.send_audio.call_count > 0
+        # Chunks are batched into larger sends (up to 64 ms of audio),
+        # so every send is a whole number of 1024-byte chunks.
         for call in session.send_audio.call_args_list:
-            assert len(call.args[0]) == 1024
+            sent = len(call.args[0])
+            assert sent > 0
+            assert sent % 1024 == 0
 
     async def test_skips_send_when_disconnected(self) -> None:
         audio_in = StubAudioInput(TEST_WAV)
@@ -4,11 +4,10 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.core.config import Settings
 from src.core.controller import RobotController
 from src.core.state_machine import RobotState
 from src.gemini.session import ServerMessage
@@ -24,28 +23,42 @@ TEST_WAV = FIXTURES / "test_tone.wav"
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 PERSONALITIES_DIR = PROJECT_ROOT / "config" / "personalities"
 
+# Shared ServerMessage literals — ServerMessage is an immutable NamedTuple,
+# so tests can safely reuse one instance instead of rebuilding it.
+MSG_TURN_COMPLETE = ServerMessage(type="turn_complete")
+MSG_SETUP_COMPLETE = ServerMessage(type="setup_complete")
+MSG_GO_AWAY = ServerMessage(type="go_away")
+MSG_ERROR = ServerMessage(type="error", text="WebSocket closed")
 
-def _make_settings(**overrides: object) -> Settings:
-    """Create a Settings object with test defaults."""
-    defaults = dict(
-        gemini_api_key="test-key",
-        gemini_model="test-model",
-        input_sample_rate=16000,
-        output_sample_rate=24000,
-        input_channels=1,
-        audio_chunk_size=1024,
-        wake_word="hey_jarvis",
-        wake_word_sensitivity=0.5,
-        default_personality="friendly",
-        personalities_dir=str(PERSONALITIES_DIR),
-        conversation_timeout=30,
-        max_session_duration=600,
-        n8n_server_url="",
-        n8n_api_key="",
-        log_level="INFO",
-    )
-    defaults.update(overrides)
-    return Settings(**defaults)
+
+async def _fire_wake_word(callback) -> None:
+    """Shared detector.start stand-in that fires the wake word at once."""
+    await callback()
+
+
+@pytest.fixture(autouse=True)
+def stub_detector(monkeypatch) -> MagicMock:
+    """Swap WakeWordDetector for a MagicMock factory on every test.
+
+    One monkeypatch replaces the per-test @patch decorators. Tests that
+    need custom detector behavior configure ``stub_detector.return_value``.
+    """
+    factory = MagicMock()
+    monkeypatch.setattr("src.core.controller.WakeWordDetector", factory)
+    return factory
+
+
+@pytest.fixture
+def stub_gemini(monkeypatch) -> MagicMock:
+    """Swap GeminiSession for a MagicMock factory returning an AsyncMock.
+
+    Tests read the constructed session via ``stub_gemini.return_value``
+    and constructor arguments via ``stub_gemini.call_args``.
+    """
+    factory = MagicMock()
+    factory.return_value = AsyncMock()
+    monkeypatch.setattr("src.core.controller.GeminiSession", factory)
+    return factory
 
 
 # ---------------------------------------------------------------------------
@@ -54,16 +67,15 @@ def _make_settings(**overrides: object) -> Settings:
 
 
 class TestRobotState:
-    def test_states_exist(self) -> None:
-        assert RobotState.IDLE is not None
-        assert RobotState.CONNECTING is not None
-        assert RobotState.CONVERSATION is not None
-        assert RobotState.SHUTTING_DOWN is not None
-
-    def test_states_are_distinct(self) -> None:
-        states = [RobotState.IDLE, RobotState.CONNECTING,
-                  RobotState.CONVERSATION, RobotState.SHUTTING_DOWN]
-        assert len(set(states)) == 4
+    def test_state_enum_shape(self) -> None:
+        """The four states exist and are distinct enum members."""
+        assert set(RobotState) >= {
+            RobotState.IDLE,
+            RobotState.CONNECTING,
+            RobotState.CONVERSATION,
+            RobotState.SHUTTING_DOWN,
+        }
+        assert len(RobotState) == 4
 
 
 # ---------------------------------------------------------------------------
@@ -72,15 +84,13 @@ class TestRobotState:
 
 
 class TestRobotControllerInit:
-    @patch("src.core.controller.WakeWordDetector")
-    def test_initial_state_is_idle(self, MockDetector: MagicMock) -> None:
-        settings = _make_settings()
+    def test_initial_state_is_idle(self, make_settings) -> None:
+        settings = make_settings()
         controller = RobotController(settings, StubAudioInput(), StubAudioOutput())
         assert controller.state == RobotState.IDLE
 
-    @patch("src.core.controller.WakeWordDetector")
-    def test_accepts_optional_display_camera(self, MockDetector: MagicMock) -> None:
-        settings = _make_settings()
+    def test_accepts_optional_display_camera(self, make_settings) -> None:
+        settings = make_settings()
         display = StubDisplayOutput()
         camera = StubCameraInput()
         controller = RobotController(
@@ -96,77 +106,46 @@ class TestRobotControllerInit:
 
 
 class TestRobotControllerIdle:
-    @patch("src.core.controller.WakeWordDetector")
     async def test_wake_word_transitions_to_connecting(
-        self, MockDetector: MagicMock
+        self, stub_detector, make_settings
     ) -> None:
-        mock_det = MagicMock()
-
-        async def fake_start(callback):
-            await callback()
-
-        mock_det.start = fake_start
-        mock_det.stop = MagicMock()
-        mock_det.is_listening = False
-        MockDetector.return_value = mock_det
+        stub_detector.return_value.start = _fire_wake_word
+        stub_detector.return_value.is_listening = False
 
-        settings = _make_settings()
-        controller = RobotController(settings, StubAudioInput(), StubAudioOutput())
+        display = StubDisplayOutput()
+        settings = make_settings()
+        controller = RobotController(
+            settings, StubAudioInput(), StubAudioOutput(), display=display
+        )
         controller._running = True
-        controller._stop_event = asyncio.Event()
 
         await controller._run_idle()
         assert controller.state == RobotState.CONNECTING
+        assert display.last_status == "listening"
 
-    @patch("src.core.controller.WakeWordDetector")
-    async def test_stop_during_idle(self, MockDetector: MagicMock) -> None:
-        mock_det = MagicMock()
+    async def test_stop_during_idle(self, stub_detector, make_settings) -> None:
+        listening = asyncio.Event()
 
         async def fake_start(callback):
-            pass  # Don't fire callback
+            listening.set()  # Don't fire callback
 
-        mock_det.start = fake_start
-        mock_det.stop = MagicMock()
-        MockDetector.return_value = mock_det
+        stub_detector.return_value.start = fake_start
 
-        settings = _make_settings()
+        settings = make_settings()
         controller = RobotController(settings, StubAudioInput(), StubAudioOutput())
         controller._running = True
-        controller._stop_event = asyncio.Event()
 
         async def delayed_stop():
-            await asyncio.sleep(0.05)
+            # Wake as soon as the detector is listening — no sleep tick.
+            await listening.wait()
             controller._running = False
             controller._stop_event.set()
 
-        asyncio.create_task(delayed_stop())
-        await controller._run_idle()
+        await asyncio.gather(controller._run_idle(), delayed_stop())
 
         # Should NOT transition to CONNECTING
         assert controller.state == RobotState.IDLE
 
-    @patch("src.core.controller.WakeWordDetector")
-    async def test_display_shows_listening(self, MockDetector: MagicMock) -> None:
-        mock_det = MagicMock()
-
-        async def fake_start(callback):
-            await callback()
-
-        mock_det.start = fake_start
-        mock_det.stop = MagicMock()
-        MockDetector.return_value = mock_det
-
-        display = StubDisplayOutput()
-        settings = _make_settings()
-        controller = RobotController(
-            settings, StubAudioInput(), StubAudioOutput(), display=display
-        )
-        controller._running = True
-        controller._stop_event = asyncio.Event()
-
-        await controller._run_idle()
-        assert display.last_status == "listening"
-
 
 # ---------------------------------------------------------------------------
 # CONNECTING state
@@ -174,35 +153,35 @@ class TestRobotControllerIdle:
 
 
 class TestRobotControllerConnecting:
-    @patch("src.core.controller.GeminiSession")
-    @patch("src.core.controller.WakeWordDetector")
     async def test_successful_connection(
-        self, MockDetector: MagicMock, MockSession: MagicMock
+        self, stub_gemini, make_settings
     ) -> None:
         mock_session = AsyncMock()
         mock_session.connect = AsyncMock()
         mock_session.is_connected = True
-        MockSession.return_value = mock_session
+        stub_gemini.return_value = mock_session
 
-        settings = _make_settings()
-        controller = RobotController(settings, StubAudioInput(), StubAudioOutput())
+        display = StubDisplayOutput()
+        settings = make_settings()
+        controller = RobotController(
+            settings, StubAudioInput(), StubAudioOutput(), display=display
+        )
         controller._running = True
         controller._state = RobotState.CONNECTING
 
         await controller._run_connecting()
         assert controller.state == RobotState.CONVERSATION
         mock_session.connect.assert_called_once()
+        assert display.last_status == "connecting"
 
-    @patch("src.core.controller.GeminiSession")
-    @patch("src.core.controller.WakeWordDetector")
     async def test_connection_failure_returns_to_idle(
-        self, MockDetector: MagicMock, MockSession: MagicMock
+        self, stub_gemini, make_settings
     ) -> None:
         mock_session = AsyncMock()
         mock_session.connect = AsyncMock(side_effect=ConnectionError("refused"))
-        MockSession.return_value = mock_session
+        stub_gemini.return_value = mock_session
 
-        settings = _make_settings()
+        settings = make_settings()
         controller = RobotController(settings, StubAudioInput(), StubAudioOutput())
         controller._running = True
         controller._state = RobotState.CONNECTING
@@ -210,36 +189,32 @@ class TestRobotControllerConnecting:
         await controller._run_connecting()
         assert controller.state == RobotState.IDLE
 
-    @patch("src.core.controller.GeminiSession")
-    @patch("src.core.controller.WakeWordDetector")
     async def test_session_config_from_personality(
-        self, MockDetector: MagicMock, MockSession: MagicMock
+        self, stub_gemini, make_settings
     ) -> None:
         mock_session = AsyncMock()
         mock_session.connect = AsyncMock()
-        MockSession.return_value = mock_session
+        stub_gemini.return_value = mock_session
 
-        settings = _make_settings(default_personality="professional")
+        settings = make_settings(default_personality="professional")
         controller = RobotController(settings, StubAudioInput(), StubAudioOutput())
         controller._running = True
         controller._state = RobotState.CONNECTING
 
         await controller._run_connecting()
 
-        call_kwargs = MockSession.call_args[1]
+        call_kwargs = stub_gemini.call_args[1]
         assert call_kwargs["config"].voice == "Kore"
         assert call_kwargs["api_key"] == "test-key"
 
-    @patch("src.core.controller.GeminiSession")
-    @patch("src.core.controller.WakeWordDetector")
     async def test_missing_personality_uses_default(
-        self, MockDetector: MagicMock, MockSession: MagicMock
+        self, stub_gemini, make_settings
     ) -> None:
         mock_session = AsyncMock()
         mock_session.connect = AsyncMock()
-        MockSession.return_value = mock_session
+        stub_gemini.return_value = mock_session
 
-        settings = _make_settings(default_personality="nonexistent")
+        settings = make_settings(default_personality="nonexistent")
         controller = RobotController(settings, StubAudioInput(), StubAudioOutput())
         controller._running = True
         controller._state = RobotState.CONNECTING
@@ -248,162 +223,132 @@ class TestRobotControllerConnecting:
         # Should fall back to "friendly" and still connect
         assert controller.state == RobotState.CONVERSATION
 
-    @patch("src.core.controller.GeminiSession")
-    @patch("src.core.controller.WakeWordDetector")
-    async def test_display_shows_connecting(
-        self, MockDetector: MagicMock, MockSession: MagicMock
-    ) -> None:
-        mock_session = AsyncMock()
-        mock_session.connect = AsyncMock()
-        MockSession.return_value = mock_session
-
-        display = StubDisplayOutput()
-        settings = _make_settings()
-        controller = RobotController(
-            settings, StubAudioInput(), StubAudioOutput(), display=display
-        )
-        controller._running = True
-        controller._state = RobotState.CONNECTING
-
-        await controller._run_connecting()
-        assert display.last_status == "connecting"
-
 
 # ---------------------------------------------------------------------------
 # CONVERSATION state
 # ---------------------------------------------------------------------------
 
 
-def _mock_session_with_messages(messages: list[ServerMessage]) -> AsyncMock:
-    """Create a mock GeminiSession that yields the given messages."""
-    mock = AsyncMock()
-    mock.is_connected = True
-    mock.connect = AsyncMock()
-    mock.close = AsyncMock()
-    mock.send_audio = AsyncMock()
-    mock.send_tool_response = AsyncMock()
-
-    async def mock_receive():
-        for msg in messages:
-            yield msg
-
-    mock.receive = mock_receive
-    return mock
+class _FakeGeminiSession:
+    """Minimal GeminiSession stand-in with only what the controller touches.
 
+    A plain class with AsyncMock leaves is much cheaper to build than a
+    full AsyncMock parent, whose attribute auto-speccing dominates the
+    setup cost of the conversation tests.
+    """
 
-class TestRobotControllerConversation:
-    @patch("src.core.controller.WakeWordDetector")
-    async def test_audio_plays_through_speaker(
-        self, MockDetector: MagicMock
-    ) -> None:
-        audio_out = StubAudioOutput()
-        settings = _make_settings()
-        controller = RobotController(
-            settings, StubAudioInput(TEST_WAV), audio_out
-        )
-        controller._running = True
-        controller._stop_event = asyncio.Event()
-        controller._session = _mock_session_with_messages([
-            ServerMessage(type="audio", audio_data=b"\xab" * 200),
-            ServerMessage(type="turn_complete"),
-        ])
-        controller._state = RobotState.CONVERSATION
-        controller._conversation_timeout = 30
+    def __init__(self, messages: list[ServerMessage]) -> None:
+        self._messages = messages
+        self.is_connected = True
+        self.connect = AsyncMock()
+        self.close = AsyncMock()
+        self.send_audio = AsyncMock()
+        self.send_tool_response = AsyncMock()
 
-        await controller._run_conversation()
+    async def receive(self):
+        for msg in self._messages:
+            yield msg
 
-        assert controller.state == RobotState.IDLE
-        assert len(audio_out.get_recorded_data()) == 200
 
-    @patch("src.core.controller.WakeWordDetector")
-    async def test_transcription_shown_on_display(
-        self, MockDetector: MagicMock
-    ) -> None:
-        display = StubDisplayOutput()
-        settings = _make_settings()
+def _mock_session_with_messages(messages: list[ServerMessage]) -> _FakeGeminiSession:
+    """Create a mock GeminiSession that yields the given messages."""
+    return _FakeGeminiSession(messages)
+
+
+def _check_audio_played(controller, audio_out, display) -> None:
+    assert controller.state == RobotState.IDLE
+    assert display.last_status == "conversation"
+    # Playback pads the 200 audio bytes to one 960-byte (20 ms) frame.
+    data = audio_out.get_recorded_data()
+    assert data[:200] == b"\xab" * 200
+    assert len(data) == 960
+
+
+def _check_transcription_displayed(controller, audio_out, display) -> None:
+    assert display.last_text == "Hello!"
+
+
+def _check_input_transcription_displayed(controller, audio_out, display) -> None:
+    assert display.last_text == "> User said hi"
+
+
+def _check_back_to_idle(controller, audio_out, display) -> None:
+    assert controller.state == RobotState.IDLE
+
+
+# (messages, check) pairs for the parametrized message-handling test.
+_CONVERSATION_CASES = [
+    pytest.param(
+        [ServerMessage(type="audio", audio_data=b"\xab" * 200),
+         MSG_TURN_COMPLETE],
+        _check_audio_played,
+        id="audio_plays_through_speaker",
+    ),
+    pytest.param(
+        [ServerMessage(type="transcription", text="Hello!"),
+         MSG_TURN_COMPLETE],
+        _check_transcription_displayed,
+        id="transcription_shown_on_display",
+    ),
+    pytest.param(
+        [ServerMessage(type="input_transcription", text="User said hi"),
+         MSG_TURN_COMPLETE],
+        _check_input_transcription_displayed,
+        id="input_transcription_shown_on_display",
+    ),
+    pytest.param(
+        [MSG_ERROR],
+        _check_back_to_idle,
+        id="error_ends_conversation",
+    ),
+    pytest.param(
+        [MSG_GO_AWAY],
+        _check_back_to_idle,
+        id="go_away_ends_conversation",
+    ),
+]
+
+
+@pytest.fixture
+def conv_ctrl(make_settings):
+    """Builder for a controller pre-configured in CONVERSATION state."""
+
+    def build(messages=None, session=None, audio_out=None, display=None):
         controller = RobotController(
-            settings, StubAudioInput(TEST_WAV), StubAudioOutput(), display=display
+            make_settings(),
+            StubAudioInput(TEST_WAV),
+            audio_out if audio_out is not None else StubAudioOutput(),
+            display=display,
         )
         controller._running = True
-        controller._stop_event = asyncio.Event()
-        controller._session = _mock_session_with_messages([
-            ServerMessage(type="transcription", text="Hello!"),
-            ServerMessage(type="turn_complete"),
-        ])
-        controller._state = RobotState.CONVERSATION
-        controller._conversation_timeout = 30
-
-        await controller._run_conversation()
-
-        assert display.last_text == "Hello!"
-
-    @patch("src.core.controller.WakeWordDetector")
-    async def test_input_transcription_shown_on_display(
-        self, MockDetector: MagicMock
-    ) -> None:
-        display = StubDisplayOutput()
-        settings = _make_settings()
-        controller = RobotController(
-            settings, StubAudioInput(TEST_WAV), StubAudioOutput(), display=display
+        controller._session = (
+            session if session is not None
+            else _mock_session_with_messages(messages or [])
         )
-        controller._running = True
-        controller._stop_event = asyncio.Event()
-        controller._session = _mock_session_with_messages([
-            ServerMessage(type="input_transcription", text="User said hi"),
-            ServerMessage(type="turn_complete"),
-        ])
         controller._state = RobotState.CONVERSATION
         controller._conversation_timeout = 30
+        return controller
 
-        await controller._run_conversation()
+    return build
 
-        assert display.last_text == "> User said hi"
 
-    @patch("src.core.controller.WakeWordDetector")
-    async def test_error_ends_conversation(
-        self, MockDetector: MagicMock
-    ) -> None:
-        settings = _make_settings()
-        controller = RobotController(
-            settings, StubAudioInput(TEST_WAV), StubAudioOutput()
-        )
-        controller._running = True
-        controller._stop_event = asyncio.Event()
-        controller._session = _mock_session_with_messages([
-            ServerMessage(type="error", text="WebSocket closed"),
-        ])
-        controller._state = RobotState.CONVERSATION
-        controller._conversation_timeout = 30
-
-        await controller._run_conversation()
-
-        assert controller.state == RobotState.IDLE
-
-    @patch("src.core.controller.WakeWordDetector")
-    async def test_go_away_ends_conversation(
-        self, MockDetector: MagicMock
+class TestRobotControllerConversation:
+    @pytest.mark.parametrize("messages, check", _CONVERSATION_CASES)
+    async def test_conversation_message(
+        self, messages, check, conv_ctrl
     ) -> None:
-        settings = _make_settings()
-        controller = RobotController(
-            settings, StubAudioInput(TEST_WAV), StubAudioOutput()
-        )
-        controller._running = True
-        controller._stop_event = asyncio.Event()
-        controller._session = _mock_session_with_messages([
-            ServerMessage(type="go_away"),
-        ])
-        controller._state = RobotState.CONVERSATION
-        controller._conversation_timeout = 30
+        """One conversation run per case; the check inspects the outcome."""
+        audio_out = StubAudioOutput()
+        display = StubDisplayOutput()
+        controller = conv_ctrl(messages, audio_out=audio_out, display=display)
 
         await controller._run_conversation()
 
-        assert controller.state == RobotState.IDLE
+        check(controller, audio_out, display)
 
-    @patch("src.core.controller.WakeWordDetector")
     async def test_tool_call_unknown_tool_sends_error(
-        self, MockDetector: MagicMock
+        self, conv_ctrl
     ) -> None:
-        settings = _make_settings()
         mock_session = _mock_session_with_messages([
             ServerMessage(
                 type="tool_call",
@@ -411,17 +356,9 @@ class TestRobotControllerConversation:
                 tool_name="nonexistent_tool",
                 tool_args={"text": "hi"},
             ),
-            ServerMessage(type="turn_complete"),
+            MSG_TURN_COMPLETE,
         ])
-
-        controller = RobotController(
-            settings, StubAudioInput(TEST_WAV), StubAudioOutput()
-        )
-        controller._running = True
-        controller._stop_event = asyncio.Event()
-        controller._session = mock_session
-        controller._state = RobotState.CONVERSATION
-        controller._conversation_timeout = 30
+        controller = conv_ctrl(session=mock_session)
 
         await controller._run_conversation()
 
@@ -429,12 +366,10 @@ class TestRobotControllerConversation:
             "c1", {"error": "Unknown tool: nonexistent_tool"}
         )
 
-    @patch("src.core.controller.WakeWordDetector")
     async def test_tool_call_executes_registered_tool(
-        self, MockDetector: MagicMock
+        self, conv_ctrl
     ) -> None:
         display = StubDisplayOutput()
-        settings = _make_settings()
         mock_session = _mock_session_with_messages([
             ServerMessage(
                 type="tool_call",
@@ -442,18 +377,9 @@ class TestRobotControllerConversation:
                 tool_name="display_text",
                 tool_args={"text": "Hello from Gemini"},
             ),
-            ServerMessage(type="turn_complete"),
+            MSG_TURN_COMPLETE,
         ])
-
-        controller = RobotController(
-            settings, StubAudioInput(TEST_WAV), StubAudioOutput(),
-            display=display,
-        )
-        controller._running = True
-        controller._stop_event = asyncio.Event()
-        controller._session = mock_session
-        controller._state = RobotState.CONVERSATION
-        controller._conversation_timeout = 30
+        controller = conv_ctrl(session=mock_session, display=display)
 
         await controller._run_conversation()
 
@@ -464,9 +390,8 @@ class TestRobotControllerConversation:
             "c2", {"status": "ok", "text": "Hello from Gemini"}
         )
 
-    @patch("src.core.controller.WakeWordDetector")
     async def test_silence_timeout_ends_conversation(
-        self, MockDetector: MagicMock
+        self, conv_ctrl
     ) -> None:
         """A very short timeout should end the conversation quickly."""
         mock_session = AsyncMock()
@@ -475,71 +400,35 @@ class TestRobotControllerConversation:
         mock_session.send_audio = AsyncMock()
 
         async def slow_receive():
-            yield ServerMessage(type="setup_complete")
+            yield MSG_SETUP_COMPLETE
             # Hang for longer than the timeout
             await asyncio.sleep(10)
             yield ServerMessage(type="audio", audio_data=b"\x00")
 
         mock_session.receive = slow_receive
 
-        settings = _make_settings()
-        controller = RobotController(
-            settings, StubAudioInput(TEST_WAV), StubAudioOutput()
-        )
-        controller._running = True
-        controller._stop_event = asyncio.Event()
-        controller._session = mock_session
-        controller._state = RobotState.CONVERSATION
-        controller._conversation_timeout = 0.1  # 100ms
+        controller = conv_ctrl(session=mock_session)
+        # Zero delay: the silence timer fires on the next loop pass, so
+        # the test exercises the timeout path without real wall time.
+        controller._conversation_timeout = 0
 
         await controller._run_conversation()
 
         assert controller.state == RobotState.IDLE
 
-    @patch("src.core.controller.WakeWordDetector")
     async def test_session_closed_after_conversation(
-        self, MockDetector: MagicMock
+        self, conv_ctrl
     ) -> None:
         mock_session = _mock_session_with_messages([
-            ServerMessage(type="turn_complete"),
+            MSG_TURN_COMPLETE,
         ])
-
-        settings = _make_settings()
-        controller = RobotController(
-            settings, StubAudioInput(TEST_WAV), StubAudioOutput()
-        )
-        controller._running = True
-        controller._stop_event = asyncio.Event()
-        controller._session = mock_session
-        controller._state = RobotState.CONVERSATION
-        controller._conversation_timeout = 30
+        controller = conv_ctrl(session=mock_session)
 
         await controller._run_conversation()
 
         mock_session.close.assert_called_once()
         assert controller._session is None
 
-    @patch("src.core.controller.WakeWordDetector")
-    async def test_display_shows_conversation(
-        self, MockDetector: MagicMock
-    ) -> None:
-        display = StubDisplayOutput()
-        settings = _make_settings()
-        controller = RobotController(
-            settings, StubAudioInput(TEST_WAV), StubAudioOutput(), display=display
-        )
-        controller._running = True
-        controller._stop_event = asyncio.Event()
-        controller._session = _mock_session_with_messages([
-            ServerMessage(type="turn_complete"),
-        ])
-        controller._state = RobotState.CONVERSATION
-        controller._conversation_timeout = 30
-
-        await controller._run_conversation()
-
-        assert display.last_status == "conversation"
-
 
 # ---------------------------------------------------------------------------
 # Full lifecycle
@@ -547,26 +436,25 @@ class TestRobotControllerConversation:
 
 
 class TestRobotControllerLifecycle:
-    @patch("src.core.controller.GeminiSession")
-    @patch("src.core.controller.WakeWordDetector")
     async def test_full_cycle_idle_to_conversation_to_idle(
-        self, MockDetector: MagicMock, MockSession: MagicMock
+        self, stub_gemini, stub_detector, make_settings
     ) -> None:
         """Full cycle: wake word → connect → conversation → idle → stop."""
         # Configure wake word detector to fire immediately
-        mock_det = MagicMock()
         call_count = 0
+        idle_again = asyncio.Event()
 
         async def fake_start(callback):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
                 await callback()  # First call: fire wake word
-            # Second call: don't fire (will be stopped externally)
+            else:
+                # Second call: IDLE was re-entered after the conversation;
+                # don't fire — signal the stop helper instead.
+                idle_again.set()
 
-        mock_det.start = fake_start
-        mock_det.stop = MagicMock()
-        MockDetector.return_value = mock_det
+        stub_detector.return_value.start = fake_start
 
         # Configure Gemini session
         mock_session = AsyncMock()
@@ -576,14 +464,14 @@ class TestRobotControllerLifecycle:
         mock_session.send_audio = AsyncMock()
 
         async def mock_receive():
-            yield ServerMessage(type="setup_complete")
+            yield MSG_SETUP_COMPLETE
             yield ServerMessage(type="audio", audio_data=b"\x00" * 48)
-            yield ServerMessage(type="turn_complete")
+            yield MSG_TURN_COMPLETE
 
         mock_session.receive = mock_receive
-        MockSession.return_value = mock_session
+        stub_gemini.return_value = mock_session
 
-        settings = _make_settings()
+        settings = make_settings()
         audio_out = StubAudioOutput()
         controller = RobotController(
             settings, StubAudioInput(TEST_WAV), audio_out
@@ -591,80 +479,54 @@ class TestRobotControllerLifecycle:
 
         # Run controller with a delayed stop
         async def delayed_stop():
-            # Wait for conversation to end and IDLE to be re-entered
-            while controller.state != RobotState.IDLE or call_count < 2:
-                await asyncio.sleep(0.02)
+            # Wakes as soon as IDLE is re-entered — no polling sleeps.
+            await idle_again.wait()
             await controller.stop()
 
-        stop_task = asyncio.create_task(delayed_stop())
-        await controller.start()
-        await stop_task
+        await asyncio.gather(controller.start(), delayed_stop())
 
         assert controller.state == RobotState.SHUTTING_DOWN
-        assert len(audio_out.get_recorded_data()) == 48
+        # The 48 audio bytes are zero-padded to one 960-byte (20 ms) frame.
+        assert len(audio_out.get_recorded_data()) == 960
 
-    @patch("src.core.controller.WakeWordDetector")
-    async def test_stop_immediately(self, MockDetector: MagicMock) -> None:
+    async def test_stop_immediately(self, stub_detector, make_settings) -> None:
         """Calling stop() immediately should exit cleanly."""
-        mock_det = MagicMock()
-
-        async def fake_start(callback):
-            pass
+        stub_detector.return_value.start = AsyncMock()
 
-        mock_det.start = fake_start
-        mock_det.stop = MagicMock()
-        MockDetector.return_value = mock_det
-
-        settings = _make_settings()
+        settings = make_settings()
         controller = RobotController(settings, StubAudioInput(), StubAudioOutput())
 
-        async def immediate_stop():
-            await asyncio.sleep(0.02)
-            await controller.stop()
-
-        asyncio.create_task(immediate_stop())
-        await controller.start()
+        start_task = asyncio.create_task(controller.start())
+        # One yield lets start() reach the idle wait; stop immediately after.
+        await asyncio.sleep(0)
+        await controller.stop()
+        await start_task
 
         assert controller.state == RobotState.SHUTTING_DOWN
 
-    @patch("src.core.controller.GeminiSession")
-    @patch("src.core.controller.WakeWordDetector")
     async def test_connection_failure_retries_idle(
-        self, MockDetector: MagicMock, MockSession: MagicMock
+        self, stub_gemini, make_settings
     ) -> None:
-        """If connection fails, robot should go back to IDLE."""
-        call_count = 0
-        mock_det = MagicMock()
-
-        async def fake_start(callback):
-            nonlocal call_count
-            call_count += 1
-            if call_count <= 2:
-                await callback()  # Keep triggering wake word
-
-        mock_det.start = fake_start
-        mock_det.stop = MagicMock()
-        MockDetector.return_value = mock_det
+        """If connection fails, robot should go back to IDLE and retry.
 
+        Drives _run_connecting directly instead of spinning the full
+        lifecycle through two wake-word cycles with polling sleeps.
+        """
         # Session always fails
         mock_session = AsyncMock()
         mock_session.connect = AsyncMock(side_effect=ConnectionError("fail"))
-        MockSession.return_value = mock_session
+        stub_gemini.return_value = mock_session
 
-        settings = _make_settings()
+        settings = make_settings()
         controller = RobotController(settings, StubAudioInput(), StubAudioOutput())
+        controller._running = True
 
-        async def delayed_stop():
-            while call_count < 2:
-                await asyncio.sleep(0.02)
-            await asyncio.sleep(0.05)
-            await controller.stop()
-
-        asyncio.create_task(delayed_stop())
-        await controller.start()
+        for _ in range(2):
+            controller._state = RobotState.CONNECTING
+            await controller._run_connecting()
+            assert controller.state == RobotState.IDLE
 
-        assert controller.state == RobotState.SHUTTING_DOWN
-        assert call_count >= 2  # Retried at least once
+        assert mock_session.connect.call_count == 2  # Retried at least once
 
 
 # ---------------------------------------------------------------------------
@@ -673,8 +535,8 @@ class TestRobotControllerLifecycle:
 
 
 class TestRobotControllerShutdown:
-    @patch("src.core.controller.WakeWordDetector")
-    async def test_cleanup_closes_resources(self, MockDetector: MagicMock) -> None:
+    async def test_stop_and_cleanup(self, stub_detector, make_settings) -> None:
+        """One controller exercises the full stop() + _cleanup() path."""
         audio_in = StubAudioInput(TEST_WAV)
         audio_in.open_stream(sample_rate=16000, chunk_size=1024)
         audio_out = StubAudioOutput()
@@ -682,30 +544,18 @@ class TestRobotControllerShutdown:
         display = StubDisplayOutput()
         display.show_text("something")
 
-        settings = _make_settings()
+        settings = make_settings()
         controller = RobotController(
             settings, audio_in, audio_out, display=display
         )
-
-        await controller._cleanup()
-
-        assert not audio_in.is_open()
-        assert not audio_out.is_open()
-        assert display.last_text == ""
-
-    @patch("src.core.controller.WakeWordDetector")
-    async def test_stop_sets_flags(self, MockDetector: MagicMock) -> None:
-        mock_det = MagicMock()
-        mock_det.stop = MagicMock()
-        MockDetector.return_value = mock_det
-
-        settings = _make_settings()
-        controller = RobotController(settings, StubAudioInput(), StubAudioOutput())
         controller._running = True
-        controller._stop_event = asyncio.Event()
 
         await controller.stop()
+        await controller._cleanup()
 
         assert not controller._running
         assert controller._stop_event.is_set()
-        mock_det.stop.assert_called()
+        stub_detector.return_value.stop.assert_called()
+        assert not audio_in.is_open()
+        assert not audio_out.is_open()
+        assert display.last_text == ""
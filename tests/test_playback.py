@@ -11,6 +11,24 @@ import pytest
 from src.audio.playback import AudioPlaybackStream
 from src.hardware.stubs import StubAudioOutput
 
+# Shared payloads built once per module instead of per test.
+ZERO_CHUNK = b"\x00" * 1024
+MARKED_CHUNK = b"\xab" * 512
+WAV_SILENCE = b"\x00" * 4800
+
+
+@pytest.fixture(scope="session")
+def silent_wav(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A 0.1 s silent 24 kHz WAV file, written once for the whole run."""
+    path = tmp_path_factory.mktemp("audio") / "silence.wav"
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(24000)
+        wf.writeframes(WAV_SILENCE)
+    return path
+
+
 
 class TestAudioPlaybackStream:
     async def test_play_chunk_opens_stream(self) -> None:
@@ -18,7 +36,7 @@ class TestAudioPlaybackStream:
         player = AudioPlaybackStream(output, buffer_chunks=1)
 
         assert not player.is_playing
-        await player.play_chunk(b"\x00" * 1024)
+        await player.play_chunk(ZERO_CHUNK)
         assert player.is_playing
         assert output.is_open()
 
@@ -29,26 +47,31 @@ class TestAudioPlaybackStream:
         player = AudioPlaybackStream(output, buffer_chunks=2)
 
         for _ in range(3):
-            await player.play_chunk(b"\x00" * 1024)
+            await player.play_chunk(ZERO_CHUNK)
 
         await player.flush()
 
-        assert len(output.get_recorded_data()) == 3 * 1024
+        # Output is re-chunked to 960-byte (20 ms) frames and the tail is
+        # zero-padded: 3072 bytes of audio round up to 4 frames.
+        assert len(output.get_recorded_data()) == 4 * 960
 
     async def test_single_chunk_with_flush(self) -> None:
         output = StubAudioOutput()
         player = AudioPlaybackStream(output, buffer_chunks=1)
 
-        await player.play_chunk(b"\xab" * 512)
+        await player.play_chunk(MARKED_CHUNK)
         await player.flush()
 
-        assert len(output.get_recorded_data()) == 512
+        # 512 bytes of audio zero-padded to one 960-byte frame.
+        data = output.get_recorded_data()
+        assert data[:512] == MARKED_CHUNK
+        assert len(data) == 960
 
     async def test_stop_interrupts(self) -> None:
         output = StubAudioOutput()
         player = AudioPlaybackStream(output, buffer_chunks=1)
 
-        await player.play_chunk(b"\x00" * 1024)
+        await player.play_chunk(ZERO_CHUNK)
         assert player.is_playing
 
         player.stop()
@@ -61,23 +84,47 @@ class TestAudioPlaybackStream:
 
         # Queue many chunks but don't start draining (buffer_chunks=100)
         for _ in range(5):
-            await player.play_chunk(b"\x00" * 1024)
+            await player.play_chunk(ZERO_CHUNK)
 
         player.stop()
         assert not player.is_playing
 
-    async def test_play_file(self, tmp_path: Path) -> None:
-        wav_path = tmp_path / "test.wav"
-        with wave.open(str(wav_path), "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(24000)
-            wf.writeframes(b"\x00" * 4800)
+    async def test_new_turn_immediately_after_stop(self) -> None:
+        """A turn started right after stop() must not lose its chunks.
 
+        stop() cancels the drain task without awaiting it, so the
+        cancelled task's finalizer runs on a later loop iteration. If a
+        new turn starts in between, the stale finalizer must not clear
+        the new turn's state.
+        """
+        output = StubAudioOutput()
+        player = AudioPlaybackStream(output, buffer_chunks=2)
+
+        # One chunk with buffer_chunks=2 parks the drain task in its
+        # buffering phase; the sleep lets it get there.
+        await player.play_chunk(ZERO_CHUNK)
+        await asyncio.sleep(0)
+        player.stop()
+
+        # New turn begins before the cancelled task's finalizer runs
+        # (no loop yield between stop() and these calls).
+        await player.play_chunk(MARKED_CHUNK)
+        await player.play_chunk(MARKED_CHUNK)
+        assert player.is_playing
+
+        await player.flush()
+
+        # Both 512-byte chunks survive: 1024 bytes padded to two
+        # 960-byte frames.
+        data = output.get_recorded_data()
+        assert data[:1024] == MARKED_CHUNK * 2
+        assert len(data) == 2 * 960
+
+    async def test_play_file(self, silent_wav: Path) -> None:
         output = StubAudioOutput()
         player = AudioPlaybackStream(output)
 
-        await player.play_file(str(wav_path))
+        await player.play_file(str(silent_wav))
 
         assert len(output.get_recorded_data()) == 4800
 
@@ -88,19 +135,12 @@ class TestAudioPlaybackStream:
         await player.play_file("/nonexistent/path.wav")
         assert not player.is_playing
 
-    async def test_stop_during_play_file_sets_flag(self, tmp_path: Path) -> None:
+    async def test_stop_during_play_file_sets_flag(self, silent_wav: Path) -> None:
         """Verify stop() clears the playing flag so play_file can exit."""
-        wav_path = tmp_path / "test.wav"
-        with wave.open(str(wav_path), "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(24000)
-            wf.writeframes(b"\x00" * 4800)
-
         output = StubAudioOutput()
         player = AudioPlaybackStream(output)
 
-        await player.play_file(str(wav_path))
+        await player.play_file(str(silent_wav))
         # After play_file completes, is_playing should be False
         assert not player.is_playing
 
@@ -121,7 +161,8 @@ class TestAudioPlaybackStream:
         await player.play_chunk(b"\x02" * 1024)
         await player.flush()
 
-        assert len(output.get_recorded_data()) == 2 * 1024
+        # Each 1024-byte turn is padded to two 960-byte frames.
+        assert len(output.get_recorded_data()) == 2 * 2 * 960
 
     async def test_flush_when_not_playing(self) -> None:
         output = StubAudioOutput()
@@ -133,7 +174,7 @@ class TestAudioPlaybackStream:
         output = StubAudioOutput()
         player = AudioPlaybackStream(output, buffer_chunks=1)
 
-        await player.play_chunk(b"\x00" * 1024)
+        await player.play_chunk(ZERO_CHUNK)
         await player.flush()
 
         assert not player.is_playing
@@ -2,38 +2,192 @@
 
 from __future__ import annotations
 
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.gemini.session import GeminiSession, GeminiSessionConfig, ServerMessage
 
+# Shared audio payloads, built once per module.
+_AUDIO_100 = b"\x00" * 100
+_AUDIO_1K = b"\x00" * 1024
+_AUDIO_2400 = b"\x00" * 2400
+_AUDIO_P1 = b"\x01" * 100
+_AUDIO_P2 = b"\x02" * 200
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 def _make_mock_message(**kwargs):
-    """Create a mock LiveServerMessage with explicit field values.
+    """Build a LiveServerMessage stand-in with explicit field values.
 
-    All fields default to None/False so that truthiness checks
-    in _parse_message behave correctly.
+    _parse_message only reads attributes from these objects, so a plain
+    SimpleNamespace (one dict allocation) replaces the far costlier
+    MagicMock graph. Fields default to None so truthiness checks in
+    _parse_message behave correctly.
     """
-    msg = MagicMock()
-    msg.setup_complete = kwargs.get("setup_complete", None)
-    msg.server_content = kwargs.get("server_content", None)
-    msg.tool_call = kwargs.get("tool_call", None)
-    msg.tool_call_cancellation = kwargs.get("tool_call_cancellation", None)
-    msg.go_away = kwargs.get("go_away", None)
-    return msg
+    return SimpleNamespace(
+        setup_complete=kwargs.get("setup_complete"),
+        server_content=kwargs.get("server_content"),
+        tool_call=kwargs.get("tool_call"),
+        tool_call_cancellation=kwargs.get("tool_call_cancellation"),
+        go_away=kwargs.get("go_away"),
+    )
+
+
+def _sc(**kwargs):
+    """Build a server_content stand-in with parser-expected defaults."""
+    ns = SimpleNamespace(
+        model_turn=None,
+        output_transcription=None,
+        input_transcription=None,
+        interrupted=False,
+        turn_complete=False,
+    )
+    ns.__dict__.update(kwargs)
+    return ns
+
+
+def _part(data=None, text=None):
+    """Build a model_turn part with an optional inline audio payload."""
+    inline = SimpleNamespace(data=data) if data is not None else None
+    return SimpleNamespace(inline_data=inline, text=text)
+
+
+def _fc(call_id, name, args):
+    """Build a function_call stand-in."""
+    return SimpleNamespace(id=call_id, name=name, args=args)
+
+
+def _async_gen(*items):
+    """Return an async generator function yielding the given items.
+
+    Stands in for the SDK session's receive(); one shared factory
+    instead of a fresh async def closure compiled in every test.
+    """
+    async def _gen():
+        for item in items:
+            yield item
+
+    return _gen
+
+
+def _raising_gen(exc: Exception):
+    """Return an async generator function that raises on first step."""
+    async def _gen():
+        raise exc
+        yield  # pragma: no cover — makes this an async generator
+
+    return _gen
+
+
+def _bare_session() -> GeminiSession:
+    """Build a GeminiSession shell for pure _parse_message tests.
+
+    _parse_message reads nothing but _tool_call_names, so skipping
+    __init__ keeps these parser tests free of session plumbing.
+    """
+    session = GeminiSession.__new__(GeminiSession)
+    session._tool_call_names = {}
+    return session
+
+
+def _check_audio(msg: ServerMessage) -> None:
+    assert len(msg.audio_data) == 2400
+
+
+def _check_transcription(msg: ServerMessage) -> None:
+    assert msg.text == "Hello world"
+
+
+def _check_input_transcription(msg: ServerMessage) -> None:
+    assert msg.text == "User said this"
+
+
+def _check_tool_call(msg: ServerMessage) -> None:
+    assert msg.tool_call_id == "call_42"
+    assert msg.tool_name == "display_text"
+    assert msg.tool_args == {"text": "hello world"}
+
+
+# One (SDK message, expected type, extra check) case per receive path.
+# The messages are plain namespaces built once at import; _parse_message
+# never mutates them, so sharing across parametrized runs is safe.
+_RECEIVE_CASES = [
+    pytest.param(
+        _make_mock_message(setup_complete=SimpleNamespace()),
+        "setup_complete",
+        None,
+        id="setup_complete",
+    ),
+    pytest.param(
+        _make_mock_message(
+            server_content=_sc(
+                model_turn=SimpleNamespace(parts=[_part(data=_AUDIO_2400)])
+            )
+        ),
+        "audio",
+        _check_audio,
+        id="audio",
+    ),
+    pytest.param(
+        _make_mock_message(
+            server_content=_sc(output_transcription=SimpleNamespace(text="Hello world"))
+        ),
+        "transcription",
+        _check_transcription,
+        id="transcription",
+    ),
+    pytest.param(
+        _make_mock_message(
+            server_content=_sc(input_transcription=SimpleNamespace(text="User said this"))
+        ),
+        "input_transcription",
+        _check_input_transcription,
+        id="input_transcription",
+    ),
+    pytest.param(
+        _make_mock_message(server_content=_sc(turn_complete=True)),
+        "turn_complete",
+        None,
+        id="turn_complete",
+    ),
+    pytest.param(
+        _make_mock_message(server_content=_sc(interrupted=True)),
+        "interrupted",
+        None,
+        id="interrupted",
+    ),
+    pytest.param(
+        _make_mock_message(
+            tool_call=SimpleNamespace(
+                function_calls=[_fc("call_42", "display_text", {"text": "hello world"})]
+            )
+        ),
+        "tool_call",
+        _check_tool_call,
+        id="tool_call",
+    ),
+    pytest.param(
+        _make_mock_message(go_away=SimpleNamespace()),
+        "go_away",
+        None,
+        id="go_away",
+    ),
+]
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def session_config() -> GeminiSessionConfig:
+    # The config dataclass is frozen, so one instance serves the module.
     return GeminiSessionConfig(
         model="gemini-2.5-flash-preview-native-audio-dialog",
         voice="Achird",
@@ -43,26 +197,68 @@ def session_config() -> GeminiSessionConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_sdk_session():
-    """Mock of the google-genai AsyncSession returned by connect()."""
+    """Mock of the google-genai AsyncSession returned by connect().
+
+    Module-scoped: the AsyncMock graph is expensive to build, and tests
+    only record calls on it, so one instance serves the whole module
+    with a per-test reset below.
+    """
     session = AsyncMock()
     session.send_realtime_input = AsyncMock()
     session.send_tool_response = AsyncMock()
     return session
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_client(mock_sdk_session):
     """Mock genai.Client whose aio.live.connect() yields mock_sdk_session."""
     client = MagicMock()
-    cm = AsyncMock()
-    cm.__aenter__ = AsyncMock(return_value=mock_sdk_session)
-    cm.__aexit__ = AsyncMock(return_value=False)
+    # MagicMock ships __aenter__/__aexit__ as AsyncMocks already; setting
+    # only their return values skips two AsyncMock constructions.
+    cm = MagicMock()
+    cm.__aenter__.return_value = mock_sdk_session
+    cm.__aexit__.return_value = False
     client.aio.live.connect = MagicMock(return_value=cm)
     return client
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _patch_genai(mock_client):
+    """Swap genai.Client for the shared mock once for the whole module.
+
+    Entering a patch context per test re-resolves and swaps the target
+    attribute every time; one start()/stop() pair covers every test.
+    """
+    patcher = patch("src.gemini.session.genai.Client", return_value=mock_client)
+    patcher.start()
+    yield
+    patcher.stop()
+
+
+@pytest.fixture(autouse=True)
+def _reset_sdk_mocks(mock_sdk_session, mock_client):
+    """Clear call records on the shared mocks before each test."""
+    mock_client.aio.live.connect.reset_mock()
+    mock_sdk_session.send_realtime_input.reset_mock()
+    mock_sdk_session.send_tool_response.reset_mock()
+
+
+@pytest.fixture
+async def connected_session(session_config):
+    """A GeminiSession already connected to the mocked SDK.
+
+    Most tests start from a connected session; building it here removes
+    the construct/connect ritual from every test body and closes the
+    session (cancelling its writer task) on teardown.
+    """
+    session = GeminiSession(api_key="test-key", config=session_config)
+    await session.connect()
+    yield session
+    await session.close()
+
+
 # ---------------------------------------------------------------------------
 # GeminiSessionConfig
 # ---------------------------------------------------------------------------
@@ -91,7 +287,7 @@ class TestGeminiSessionConfig:
 
 class TestServerMessage:
     def test_audio_message(self) -> None:
-        msg = ServerMessage(type="audio", audio_data=b"\x00" * 100)
+        msg = ServerMessage(type="audio", audio_data=_AUDIO_100)
         assert msg.type == "audio"
         assert len(msg.audio_data) == 100
 
@@ -118,33 +314,43 @@ class TestServerMessage:
 # ---------------------------------------------------------------------------
 
 class TestGeminiSessionLifecycle:
-    async def test_connect(self, session_config, mock_client) -> None:
-        with patch("src.gemini.session.genai.Client", return_value=mock_client):
-            session = GeminiSession(api_key="test-key", config=session_config)
-            assert not session.is_connected
-            await session.connect()
-            assert session.is_connected
-
-    async def test_close(self, session_config, mock_client) -> None:
-        with patch("src.gemini.session.genai.Client", return_value=mock_client):
-            session = GeminiSession(api_key="test-key", config=session_config)
-            await session.connect()
-            assert session.is_connected
-            await session.close()
-            assert not session.is_connected
+    async def test_connect(self, session_config) -> None:
+        session = GeminiSession(api_key="test-key", config=session_config)
+        assert not session.is_connected
+        await session.connect()
+        assert session.is_connected
+
+    async def test_close(self, connected_session) -> None:
+        assert connected_session.is_connected
+        await connected_session.close()
+        assert not connected_session.is_connected
 
     async def test_close_when_not_connected(self, session_config) -> None:
         session = GeminiSession(api_key="test-key", config=session_config)
         await session.close()  # Should not raise
         assert not session.is_connected
 
-    async def test_connect_passes_config(self, session_config, mock_client) -> None:
-        with patch("src.gemini.session.genai.Client", return_value=mock_client):
-            session = GeminiSession(api_key="test-key", config=session_config)
-            await session.connect()
-            mock_client.aio.live.connect.assert_called_once()
-            call_kwargs = mock_client.aio.live.connect.call_args[1]
-            assert call_kwargs["model"] == session_config.model
+    async def test_connect_passes_config(
+        self, connected_session, session_config, mock_client
+    ) -> None:
+        mock_client.aio.live.connect.assert_called_once()
+        call_kwargs = mock_client.aio.live.connect.call_args[1]
+        assert call_kwargs["model"] == session_config.model
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            pytest.param(lambda s: s.send_audio(_AUDIO_1K), id="send_audio"),
+            pytest.param(
+                lambda s: s.send_tool_response("id", {}), id="send_tool_response"
+            ),
+            pytest.param(lambda s: anext(s.receive()), id="receive"),
+        ],
+    )
+    async def test_not_connected_raises(self, session_config, call) -> None:
+        session = GeminiSession(api_key="test-key", config=session_config)
+        with pytest.raises(RuntimeError, match="not connected"):
+            await call(session)
 
 
 # ---------------------------------------------------------------------------
@@ -152,17 +358,11 @@ class TestGeminiSessionLifecycle:
 # ---------------------------------------------------------------------------
 
 class TestGeminiSessionSendAudio:
-    async def test_send_audio(self, session_config, mock_client, mock_sdk_session) -> None:
-        with patch("src.gemini.session.genai.Client", return_value=mock_client):
-            session = GeminiSession(api_key="test-key", config=session_config)
-            await session.connect()
-            await session.send_audio(b"\x00" * 1024)
-            mock_sdk_session.send_realtime_input.assert_called_once()
-
-    async def test_send_audio_not_connected_raises(self, session_config) -> None:
-        session = GeminiSession(api_key="test-key", config=session_config)
-        with pytest.raises(RuntimeError, match="not connected"):
-            await session.send_audio(b"\x00" * 1024)
+    async def test_send_audio(self, connected_session, mock_sdk_session) -> None:
+        await connected_session.send_audio(_AUDIO_1K)
+        # Chunks are flushed by a background writer task.
+        await asyncio.sleep(0.01)
+        mock_sdk_session.send_realtime_input.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -171,29 +371,17 @@ class TestGeminiSessionSendAudio:
 
 class TestGeminiSessionToolResponse:
     async def test_send_tool_response(
-        self, session_config, mock_client, mock_sdk_session
+        self, connected_session, mock_sdk_session
     ) -> None:
-        with patch("src.gemini.session.genai.Client", return_value=mock_client):
-            session = GeminiSession(api_key="test-key", config=session_config)
-            await session.connect()
-
-            # Simulate receiving a tool call first (stores name mapping)
-            fc = MagicMock()
-            fc.id = "call_1"
-            fc.name = "test_tool"
-            fc.args = {}
-            tc_msg = _make_mock_message(
-                tool_call=MagicMock(function_calls=[fc])
-            )
-            session._parse_message(tc_msg)
-
-            await session.send_tool_response("call_1", {"result": "ok"})
-            mock_sdk_session.send_tool_response.assert_called_once()
+        # Simulate receiving a tool call first (stores name mapping)
+        tc_msg = _make_mock_message(
+            tool_call=SimpleNamespace(function_calls=[_fc("call_1", "test_tool", {})])
+        )
+        # Consume the lazy parser so the name mapping is stored.
+        list(connected_session._parse_message(tc_msg))
 
-    async def test_send_tool_response_not_connected_raises(self, session_config) -> None:
-        session = GeminiSession(api_key="test-key", config=session_config)
-        with pytest.raises(RuntimeError, match="not connected"):
-            await session.send_tool_response("id", {})
+        await connected_session.send_tool_response("call_1", {"result": "ok"})
+        mock_sdk_session.send_tool_response.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -201,224 +389,34 @@ class TestGeminiSessionToolResponse:
 # ---------------------------------------------------------------------------
 
 class TestGeminiSessionReceive:
-    async def test_receive_not_connected_raises(self, session_config) -> None:
-        session = GeminiSession(api_key="test-key", config=session_config)
-        with pytest.raises(RuntimeError, match="not connected"):
-            async for _ in session.receive():
-                pass
-
-    async def test_receive_setup_complete(
-        self, session_config, mock_client, mock_sdk_session
-    ) -> None:
-        msg = _make_mock_message(setup_complete=MagicMock())
-
-        async def mock_receive():
-            yield msg
-
-        mock_sdk_session.receive = mock_receive
-
-        with patch("src.gemini.session.genai.Client", return_value=mock_client):
-            session = GeminiSession(api_key="test-key", config=session_config)
-            await session.connect()
-            messages = [m async for m in session.receive()]
-
-        assert len(messages) == 1
-        assert messages[0].type == "setup_complete"
-
-    async def test_receive_audio(
-        self, session_config, mock_client, mock_sdk_session
-    ) -> None:
-        part = MagicMock()
-        part.inline_data = MagicMock()
-        part.inline_data.data = b"\x00" * 2400
-        part.text = None
-
-        sc = MagicMock()
-        sc.model_turn = MagicMock(parts=[part])
-        sc.output_transcription = None
-        sc.input_transcription = None
-        sc.interrupted = False
-        sc.turn_complete = False
-
-        msg = _make_mock_message(server_content=sc)
-
-        async def mock_receive():
-            yield msg
-
-        mock_sdk_session.receive = mock_receive
-
-        with patch("src.gemini.session.genai.Client", return_value=mock_client):
-            session = GeminiSession(api_key="test-key", config=session_config)
-            await session.connect()
-            messages = [m async for m in session.receive()]
-
-        assert len(messages) == 1
-        assert messages[0].type == "audio"
-        assert len(messages[0].audio_data) == 2400
-
-    async def test_receive_transcription(
-        self, session_config, mock_client, mock_sdk_session
-    ) -> None:
-        sc = MagicMock()
-        sc.model_turn = None
-        sc.output_transcription = MagicMock(text="Hello world")
-        sc.input_transcription = None
-        sc.interrupted = False
-        sc.turn_complete = False
-
-        msg = _make_mock_message(server_content=sc)
-
-        async def mock_receive():
-            yield msg
-
-        mock_sdk_session.receive = mock_receive
-
-        with patch("src.gemini.session.genai.Client", return_value=mock_client):
-            session = GeminiSession(api_key="test-key", config=session_config)
-            await session.connect()
-            messages = [m async for m in session.receive()]
-
-        assert len(messages) == 1
-        assert messages[0].type == "transcription"
-        assert messages[0].text == "Hello world"
-
-    async def test_receive_input_transcription(
-        self, session_config, mock_client, mock_sdk_session
-    ) -> None:
-        sc = MagicMock()
-        sc.model_turn = None
-        sc.output_transcription = None
-        sc.input_transcription = MagicMock(text="User said this")
-        sc.interrupted = False
-        sc.turn_complete = False
-
-        msg = _make_mock_message(server_content=sc)
-
-        async def mock_receive():
-            yield msg
-
-        mock_sdk_session.receive = mock_receive
-
-        with patch("src.gemini.session.genai.Client", return_value=mock_client):
-            session = GeminiSession(api_key="test-key", config=session_config)
-            await session.connect()
-            messages = [m async for m in session.receive()]
-
-        assert len(messages) == 1
-        assert messages[0].type == "input_transcription"
-        assert messages[0].text == "User said this"
-
-    async def test_receive_turn_complete(
-        self, session_config, mock_client, mock_sdk_session
-    ) -> None:
-        sc = MagicMock()
-        sc.model_turn = None
-        sc.output_transcription = None
-        sc.input_transcription = None
-        sc.interrupted = False
-        sc.turn_complete = True
-
-        msg = _make_mock_message(server_content=sc)
-
-        async def mock_receive():
-            yield msg
-
-        mock_sdk_session.receive = mock_receive
-
-        with patch("src.gemini.session.genai.Client", return_value=mock_client):
-            session = GeminiSession(api_key="test-key", config=session_config)
-            await session.connect()
-            messages = [m async for m in session.receive()]
-
-        assert any(m.type == "turn_complete" for m in messages)
-
-    async def test_receive_interrupted(
-        self, session_config, mock_client, mock_sdk_session
+    @pytest.mark.parametrize("sdk_message, expected_type, check", _RECEIVE_CASES)
+    async def test_receive_dispatch(
+        self, connected_session, mock_sdk_session, sdk_message, expected_type, check
     ) -> None:
-        sc = MagicMock()
-        sc.model_turn = None
-        sc.output_transcription = None
-        sc.input_transcription = None
-        sc.interrupted = True
-        sc.turn_complete = False
-
-        msg = _make_mock_message(server_content=sc)
-
-        async def mock_receive():
-            yield msg
+        mock_sdk_session.receive = _async_gen(sdk_message)
 
-        mock_sdk_session.receive = mock_receive
-
-        with patch("src.gemini.session.genai.Client", return_value=mock_client):
-            session = GeminiSession(api_key="test-key", config=session_config)
-            await session.connect()
-            messages = [m async for m in session.receive()]
-
-        assert any(m.type == "interrupted" for m in messages)
-
-    async def test_receive_tool_call(
-        self, session_config, mock_client, mock_sdk_session
-    ) -> None:
-        fc = MagicMock()
-        fc.id = "call_42"
-        fc.name = "display_text"
-        fc.args = {"text": "hello world"}
+        # Every case yields exactly one message, so a single anext step
+        # replaces draining the generator to StopAsyncIteration.
+        gen = connected_session.receive()
+        msg = await anext(gen)
+        await gen.aclose()
 
-        msg = _make_mock_message(
-            tool_call=MagicMock(function_calls=[fc])
-        )
-
-        async def mock_receive():
-            yield msg
-
-        mock_sdk_session.receive = mock_receive
-
-        with patch("src.gemini.session.genai.Client", return_value=mock_client):
-            session = GeminiSession(api_key="test-key", config=session_config)
-            await session.connect()
-            messages = [m async for m in session.receive()]
-
-        assert len(messages) == 1
-        assert messages[0].type == "tool_call"
-        assert messages[0].tool_name == "display_text"
-        assert messages[0].tool_call_id == "call_42"
-        assert messages[0].tool_args == {"text": "hello world"}
-
-    async def test_receive_go_away(
-        self, session_config, mock_client, mock_sdk_session
-    ) -> None:
-        msg = _make_mock_message(go_away=MagicMock())
-
-        async def mock_receive():
-            yield msg
-
-        mock_sdk_session.receive = mock_receive
-
-        with patch("src.gemini.session.genai.Client", return_value=mock_client):
-            session = GeminiSession(api_key="test-key", config=session_config)
-            await session.connect()
-            messages = [m async for m in session.receive()]
-
-        assert any(m.type == "go_away" for m in messages)
+        assert msg.type == expected_type
+        if check is not None:
+            check(msg)
 
     async def test_receive_error_yields_error_message(
-        self, session_config, mock_client, mock_sdk_session
+        self, connected_session, mock_sdk_session
     ) -> None:
-        async def mock_receive():
-            raise ConnectionError("WebSocket closed")
-            yield  # pragma: no cover — makes this an async generator
+        mock_sdk_session.receive = _raising_gen(ConnectionError("WebSocket closed"))
 
-        mock_sdk_session.receive = mock_receive
+        gen = connected_session.receive()
+        msg = await anext(gen)
+        await gen.aclose()
 
-        with patch("src.gemini.session.genai.Client", return_value=mock_client):
-            session = GeminiSession(api_key="test-key", config=session_config)
-            await session.connect()
-            messages = [m async for m in session.receive()]
-
-        assert len(messages) == 1
-        assert messages[0].type == "error"
-        assert "WebSocket closed" in messages[0].text
-        assert not session.is_connected
+        assert msg.type == "error"
+        assert "WebSocket closed" in msg.text
+        assert not connected_session.is_connected
 
 
 # ---------------------------------------------------------------------------
@@ -426,56 +424,44 @@ class TestGeminiSessionReceive:
 # ---------------------------------------------------------------------------
 
 class TestParseMessage:
-    def test_empty_message_returns_empty(self, session_config) -> None:
-        session = GeminiSession(api_key="k", config=session_config)
+    def test_empty_message_returns_empty(self) -> None:
+        session = _bare_session()
         msg = _make_mock_message()
-        assert session._parse_message(msg) == []
-
-    def test_multiple_audio_parts(self, session_config) -> None:
-        part1 = MagicMock()
-        part1.inline_data = MagicMock(data=b"\x01" * 100)
-        part1.text = None
-
-        part2 = MagicMock()
-        part2.inline_data = MagicMock(data=b"\x02" * 200)
-        part2.text = None
+        assert list(session._parse_message(msg)) == []
 
-        sc = MagicMock()
-        sc.model_turn = MagicMock(parts=[part1, part2])
-        sc.output_transcription = None
-        sc.input_transcription = None
-        sc.interrupted = False
-        sc.turn_complete = False
+    def test_multiple_audio_parts(self) -> None:
+        sc = _sc(
+            model_turn=SimpleNamespace(
+                parts=[_part(data=_AUDIO_P1), _part(data=_AUDIO_P2)]
+            )
+        )
 
-        session = GeminiSession(api_key="k", config=session_config)
-        results = session._parse_message(_make_mock_message(server_content=sc))
+        session = _bare_session()
+        results = list(session._parse_message(_make_mock_message(server_content=sc)))
 
+        # Audio parts within one SDK message are fused into a single
+        # ServerMessage to cut per-part overhead downstream.
         audio_msgs = [r for r in results if r.type == "audio"]
-        assert len(audio_msgs) == 2
-        assert len(audio_msgs[0].audio_data) == 100
-        assert len(audio_msgs[1].audio_data) == 200
+        assert len(audio_msgs) == 1
+        assert audio_msgs[0].audio_data == _AUDIO_P1 + _AUDIO_P2
 
-    def test_tool_call_stores_name_mapping(self, session_config) -> None:
-        fc = MagicMock()
-        fc.id = "c1"
-        fc.name = "my_tool"
-        fc.args = {"x": 1}
-
-        msg = _make_mock_message(tool_call=MagicMock(function_calls=[fc]))
+    def test_tool_call_stores_name_mapping(self) -> None:
+        msg = _make_mock_message(
+            tool_call=SimpleNamespace(function_calls=[_fc("c1", "my_tool", {"x": 1})])
+        )
 
-        session = GeminiSession(api_key="k", config=session_config)
-        session._parse_message(msg)
+        session = _bare_session()
+        list(session._parse_message(msg))
 
         assert session._tool_call_names["c1"] == "my_tool"
 
-    def test_tool_call_cancellation(self, session_config) -> None:
-        cancel = MagicMock()
-        cancel.ids = ["c1", "c2"]
-
-        msg = _make_mock_message(tool_call_cancellation=cancel)
+    def test_tool_call_cancellation(self) -> None:
+        msg = _make_mock_message(
+            tool_call_cancellation=SimpleNamespace(ids=["c1", "c2"])
+        )
 
-        session = GeminiSession(api_key="k", config=session_config)
-        results = session._parse_message(msg)
+        session = _bare_session()
+        results = list(session._parse_message(msg))
 
         assert len(results) == 1
         assert results[0].type == "tool_call_cancellation"
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-import base64
+from binascii import a2b_base64
 from pathlib import Path
 
 import pytest
@@ -15,6 +15,9 @@ from src.tools.server import ToolDefinition, ToolParam, ToolServer
 
 FIXTURES = Path(__file__).parent / "fixtures"
 TEST_IMAGE = FIXTURES / "test_image.jpg"
+# Read once per module — the camera tests compare against these bytes
+# repeatedly and never need to go back to disk.
+_TEST_IMAGE_BYTES = TEST_IMAGE.read_bytes()
 
 
 # ---------------------------------------------------------------------------
@@ -265,51 +268,62 @@ class TestToolServerBuiltins:
 # ---------------------------------------------------------------------------
 
 
+# Discovery scenarios: files written into the tools directory and the
+# tool names that should end up registered.
+_DISCOVERY_CASES = [
+    pytest.param({}, [], id="empty-directory"),
+    pytest.param(
+        {
+            "my_tool.py": (
+                "from src.tools.server import ToolDefinition\n"
+                "TOOLS = [\n"
+                "    ToolDefinition(name='my_tool', description='Custom tool',\n"
+                "                   handler=lambda: {'custom': True}),\n"
+                "]\n"
+            )
+        },
+        ["my_tool"],
+        id="valid-tool",
+    ),
+    pytest.param(
+        {
+            "__init__.py": "",
+            "_private.py": (
+                "from src.tools.server import ToolDefinition\n"
+                "TOOLS = [ToolDefinition(name='private', description='X')]\n"
+            ),
+        },
+        [],
+        id="skip-underscore-files",
+    ),
+    pytest.param(
+        {"broken.py": "raise RuntimeError('bad')\n"},
+        [],
+        id="skip-broken-modules",
+    ),
+    pytest.param(
+        {"misc.py": "TOOLS = ['not_a_tool', 42]\n"},
+        [],
+        id="skip-non-tool-items",
+    ),
+]
+
+
 class TestToolServerDiscovery:
     def test_missing_directory(self) -> None:
         server = ToolServer()
         server.discover_user_tools("/nonexistent/path")
         assert server.registered_tools == []
 
-    def test_empty_directory(self, tmp_path: Path) -> None:
-        server = ToolServer()
-        server.discover_user_tools(str(tmp_path))
-        assert server.registered_tools == []
-
-    def test_discover_valid_tool(self, tmp_path: Path) -> None:
-        tool_file = tmp_path / "my_tool.py"
-        tool_file.write_text(
-            "from src.tools.server import ToolDefinition\n"
-            "TOOLS = [\n"
-            "    ToolDefinition(name='my_tool', description='Custom tool',\n"
-            "                   handler=lambda: {'custom': True}),\n"
-            "]\n"
-        )
-        server = ToolServer()
-        server.discover_user_tools(str(tmp_path))
-        assert "my_tool" in server.registered_tools
-
-    def test_skip_underscore_files(self, tmp_path: Path) -> None:
-        (tmp_path / "__init__.py").write_text("")
-        (tmp_path / "_private.py").write_text(
-            "from src.tools.server import ToolDefinition\n"
-            "TOOLS = [ToolDefinition(name='private', description='X')]\n"
-        )
-        server = ToolServer()
-        server.discover_user_tools(str(tmp_path))
-        assert server.registered_tools == []
-
-    def test_skip_broken_modules(self, tmp_path: Path) -> None:
-        (tmp_path / "broken.py").write_text("raise RuntimeError('bad')\n")
-        server = ToolServer()
-        server.discover_user_tools(str(tmp_path))
-        assert server.registered_tools == []
-
-    def test_skip_non_tool_items(self, tmp_path: Path) -> None:
-        (tmp_path / "misc.py").write_text("TOOLS = ['not_a_tool', 42]\n")
+    @pytest.mark.parametrize("files,expected", _DISCOVERY_CASES)
+    def test_discovery(
+        self, tmp_path: Path, files: dict[str, str], expected: list[str]
+    ) -> None:
+        for name, content in files.items():
+            (tmp_path / name).write_text(content)
         server = ToolServer()
         server.discover_user_tools(str(tmp_path))
-        assert server.registered_tools == []
+        assert sorted(server.registered_tools) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -367,49 +381,61 @@ class TestDisplayTools:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def stub_camera() -> StubCameraInput:
+    """Shared placeholder-JPEG camera — the stub is stateless."""
+    return StubCameraInput()
+
+
+@pytest.fixture(scope="module")
+def stub_camera_with_image() -> StubCameraInput:
+    """Shared camera serving the fixture test image (read once)."""
+    return StubCameraInput(TEST_IMAGE)
+
+
 class TestCameraTools:
-    def test_creates_one_tool(self) -> None:
-        camera = StubCameraInput()
-        tools = create_camera_tools(camera)
+    def test_creates_one_tool(self, stub_camera: StubCameraInput) -> None:
+        tools = create_camera_tools(stub_camera)
         assert len(tools) == 1
         assert tools[0].name == "capture_camera_frame"
 
-    def test_capture_returns_base64(self) -> None:
-        camera = StubCameraInput()
-        tools = create_camera_tools(camera)
+    def test_capture_returns_base64(self, stub_camera: StubCameraInput) -> None:
+        tools = create_camera_tools(stub_camera)
         result = tools[0].handler()
         assert "image" in result
         assert result["mime_type"] == "image/jpeg"
-        # Verify base64 is decodable
-        decoded = base64.b64decode(result["image"])
+        # Verify base64 is decodable (a2b_base64 is the direct C
+        # decoder underneath base64.b64decode).
+        decoded = a2b_base64(result["image"])
         assert len(decoded) > 0
 
-    def test_capture_with_test_image(self) -> None:
-        camera = StubCameraInput(TEST_IMAGE)
-        tools = create_camera_tools(camera)
+    def test_capture_with_test_image(
+        self, stub_camera_with_image: StubCameraInput
+    ) -> None:
+        tools = create_camera_tools(stub_camera_with_image)
         result = tools[0].handler()
-        decoded = base64.b64decode(result["image"])
-        assert decoded == TEST_IMAGE.read_bytes()
-        assert result["size_bytes"] == len(TEST_IMAGE.read_bytes())
+        decoded = a2b_base64(result["image"])
+        assert decoded == _TEST_IMAGE_BYTES
+        assert result["size_bytes"] == len(_TEST_IMAGE_BYTES)
 
-    def test_capture_stub_minimal_jpeg(self) -> None:
-        camera = StubCameraInput()  # No image path → minimal JPEG
-        tools = create_camera_tools(camera)
+    def test_capture_stub_minimal_jpeg(self, stub_camera: StubCameraInput) -> None:
+        # No image path → minimal JPEG
+        tools = create_camera_tools(stub_camera)
         result = tools[0].handler()
-        decoded = base64.b64decode(result["image"])
+        decoded = a2b_base64(result["image"])
         # StubCameraInput returns SOI+EOI markers
         assert decoded == b"\xff\xd8\xff\xd9"
         assert result["size_bytes"] == 4
 
-    def test_capture_has_no_params(self) -> None:
-        camera = StubCameraInput()
-        tools = create_camera_tools(camera)
+    def test_capture_has_no_params(self, stub_camera: StubCameraInput) -> None:
+        tools = create_camera_tools(stub_camera)
         assert tools[0].parameters == {}
 
-    async def test_camera_tool_via_server(self) -> None:
-        camera = StubCameraInput()
+    async def test_camera_tool_via_server(
+        self, stub_camera: StubCameraInput
+    ) -> None:
         server = ToolServer()
-        server.register_builtin_tools(camera=camera)
+        server.register_builtin_tools(camera=stub_camera)
         result = await server.execute_tool("capture_camera_frame", {})
         assert result["mime_type"] == "image/jpeg"
         assert "image" in result
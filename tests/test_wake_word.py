@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Callable, Iterator
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -15,255 +16,292 @@ FIXTURES = Path(__file__).parent / "fixtures"
 TEST_WAV = FIXTURES / "test_tone.wav"
 
 
-class TestWakeWordDetector:
-    async def test_start_and_stop(self) -> None:
-        audio_in = StubAudioInput(TEST_WAV)
-
-        with patch("src.wake_word.detector.OWWModel") as MockModel:
-            mock_model = MagicMock()
-            mock_model.predict.return_value = {"test_model": 0.0}
-            MockModel.return_value = mock_model
+class _AsyncCallCounter:
+    """Minimal async callback stand-in for AsyncMock.
 
-            detector = WakeWordDetector(
-                audio_in, wake_word="hey_jarvis", sensitivity=0.5
-            )
-            callback = AsyncMock()
+    The wake-word tests only check call counts, so this skips
+    AsyncMock's spec machinery and per-call coroutine wrapping inside
+    the detection loop. The method names mirror the AsyncMock API.
+    """
 
-            await detector.start(callback)
-            assert detector.is_listening
+    def __init__(self) -> None:
+        self.call_count = 0
 
-            await asyncio.sleep(0.1)
+    async def __call__(self, *args: object, **kwargs: object) -> None:
+        self.call_count += 1
 
-            detector.stop()
-            assert not detector.is_listening
+    def reset_mock(self) -> None:
+        self.call_count = 0
 
-    async def test_fires_callback_on_detection(self) -> None:
-        audio_in = StubAudioInput(TEST_WAV)
+    def assert_not_called(self) -> None:
+        assert self.call_count == 0, (
+            f"callback unexpectedly called {self.call_count} time(s)"
+        )
 
-        with patch("src.wake_word.detector.OWWModel") as MockModel:
-            mock_model = MagicMock()
-            mock_model.predict.return_value = {"test_model": 0.8}
-            MockModel.return_value = mock_model
 
-            detector = WakeWordDetector(
-                audio_in, wake_word="hey_jarvis", sensitivity=0.5
-            )
-            callback = AsyncMock()
+async def _drain_until(condition: Callable[[], bool], timeout: float = 2.0) -> None:
+    """Yield to the detection loop until ``condition()`` holds.
 
-            await detector.start(callback)
-            await asyncio.sleep(0.2)
-            detector.stop()
-
-            assert callback.call_count >= 1
+    Replaces fixed asyncio.sleep pauses: returns as soon as the loop has
+    done the work under test instead of idling for wall-clock time, and
+    fails loudly (instead of passing vacuously) if it never happens.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        if loop.time() >= deadline:
+            raise AssertionError("detection loop did not reach expected state")
+        await asyncio.sleep(0)
 
-    async def test_no_callback_below_sensitivity(self) -> None:
-        audio_in = StubAudioInput(TEST_WAV)
 
-        with patch("src.wake_word.detector.OWWModel") as MockModel:
-            mock_model = MagicMock()
-            mock_model.predict.return_value = {"test_model": 0.3}
-            MockModel.return_value = mock_model
+def _count_reads(audio_in: StubAudioInput) -> Callable[[], int]:
+    """Wrap ``audio_in.read_chunk`` with a call counter.
 
-            detector = WakeWordDetector(
-                audio_in, wake_word="hey_jarvis", sensitivity=0.5
-            )
-            callback = AsyncMock()
+    Returns:
+        A zero-arg callable reporting how many chunks have been read —
+        the progress signal for tests asserting that nothing happens.
+    """
+    reads = 0
+    original = audio_in.read_chunk
 
-            await detector.start(callback)
-            await asyncio.sleep(0.2)
-            detector.stop()
+    def counting_read() -> bytes:
+        nonlocal reads
+        reads += 1
+        return original()
 
-            callback.assert_not_called()
+    audio_in.read_chunk = counting_read  # type: ignore[method-assign]
+    return lambda: reads
 
-    async def test_pause_prevents_detection(self) -> None:
-        audio_in = StubAudioInput(TEST_WAV)
 
-        with patch("src.wake_word.detector.OWWModel") as MockModel:
-            mock_model = MagicMock()
-            mock_model.predict.return_value = {"test_model": 0.9}
-            MockModel.return_value = mock_model
+@pytest.fixture(scope="module", autouse=True)
+def _mock_oww_cls() -> Iterator[MagicMock]:
+    """Patch the OWWModel class once for the whole module.
 
-            detector = WakeWordDetector(
-                audio_in, wake_word="hey_jarvis", sensitivity=0.5
-            )
-            callback = AsyncMock()
+    Installing the patch per test repeated the same stack manipulation
+    thirteen times; one module-scoped patcher covers every test.
+    """
+    patcher = patch("src.wake_word.detector.OWWModel")
+    yield patcher.start()
+    patcher.stop()
 
-            await detector.start(callback)
 
-            # Pause immediately
-            detector.pause()
-            assert not detector.is_listening
+@pytest.fixture
+def mock_model(_mock_oww_cls: MagicMock) -> MagicMock:
+    """Fresh mock OWW model wired as the patched class's instance.
 
-            callback.reset_mock()
-            await asyncio.sleep(0.15)
-            callback.assert_not_called()
+    Defaults to never detecting; tests raise the score or install a
+    predict side effect as needed.
+    """
+    mock = MagicMock()
+    mock.predict.return_value = {"test_model": 0.0}
+    _mock_oww_cls.return_value = mock
+    return mock
 
-            detector.stop()
 
-    async def test_resume_after_pause(self) -> None:
-        audio_in = StubAudioInput(TEST_WAV)
+@pytest.fixture
+def audio_in() -> StubAudioInput:
+    """Audio input fed from the shared test tone fixture.
 
-        with patch("src.wake_word.detector.OWWModel") as MockModel:
-            mock_model = MagicMock()
-            mock_model.predict.return_value = {"test_model": 0.9}
-            MockModel.return_value = mock_model
+    The PCM payload is cached by the stub layer, so repeated
+    construction does not re-read the WAV from disk.
+    """
+    return StubAudioInput(TEST_WAV)
 
-            detector = WakeWordDetector(
-                audio_in, wake_word="hey_jarvis", sensitivity=0.5
-            )
-            callback = AsyncMock()
 
-            await detector.start(callback)
-            detector.pause()
-            callback.reset_mock()
+class TestWakeWordDetector:
+    async def test_start_and_stop(
+        self, audio_in: StubAudioInput, mock_model: MagicMock
+    ) -> None:
+        detector = WakeWordDetector(audio_in, wake_word="hey_jarvis", sensitivity=0.5)
+        callback = _AsyncCallCounter()
+
+        await detector.start(callback)
+        assert detector.is_listening
+
+        await _drain_until(lambda: mock_model.predict.call_count >= 1)
+
+        detector.stop()
+        assert not detector.is_listening
+
+    @pytest.mark.parametrize(
+        "score,expect_callback",
+        [
+            pytest.param(0.0, False, id="zero-score"),
+            pytest.param(0.3, False, id="below-threshold"),
+            pytest.param(0.8, True, id="above-threshold"),
+            pytest.param(0.9, True, id="high-score"),
+        ],
+    )
+    async def test_detection_threshold(
+        self,
+        audio_in: StubAudioInput,
+        mock_model: MagicMock,
+        score: float,
+        expect_callback: bool,
+    ) -> None:
+        """The callback fires iff the model score reaches the sensitivity."""
+        mock_model.predict.return_value = {"test_model": score}
+
+        detector = WakeWordDetector(audio_in, wake_word="hey_jarvis", sensitivity=0.5)
+        callback = _AsyncCallCounter()
+
+        await detector.start(callback)
+        if expect_callback:
+            await _drain_until(lambda: callback.call_count >= 1)
+        else:
+            await _drain_until(lambda: mock_model.predict.call_count >= 3)
+        detector.stop()
+
+        if expect_callback:
+            assert callback.call_count >= 1
+        else:
+            callback.assert_not_called()
 
-            # Resume — should detect again
-            detector.resume()
-            assert detector.is_listening
-            await asyncio.sleep(0.15)
-            detector.stop()
+    async def test_pause_prevents_detection(
+        self, audio_in: StubAudioInput, mock_model: MagicMock
+    ) -> None:
+        read_count = _count_reads(audio_in)
+        mock_model.predict.return_value = {"test_model": 0.9}
 
-            assert callback.call_count >= 1
+        detector = WakeWordDetector(audio_in, wake_word="hey_jarvis", sensitivity=0.5)
+        callback = _AsyncCallCounter()
 
-    async def test_pause_resets_model(self) -> None:
-        audio_in = StubAudioInput(TEST_WAV)
+        await detector.start(callback)
 
-        with patch("src.wake_word.detector.OWWModel") as MockModel:
-            mock_model = MagicMock()
-            mock_model.predict.return_value = {"test_model": 0.0}
-            MockModel.return_value = mock_model
+        # Pause immediately
+        detector.pause()
+        assert not detector.is_listening
 
-            detector = WakeWordDetector(
-                audio_in, wake_word="hey_jarvis", sensitivity=0.5
-            )
-            callback = AsyncMock()
+        # Let the loop complete several paused iterations, then
+        # confirm none of them fired the callback.
+        callback.reset_mock()
+        reads_at_pause = read_count()
+        await _drain_until(lambda: read_count() >= reads_at_pause + 3)
+        callback.assert_not_called()
 
-            await detector.start(callback)
-            detector.pause()
-            mock_model.reset.assert_called()
-            detector.stop()
+        detector.stop()
 
-    async def test_resume_resets_model(self) -> None:
-        audio_in = StubAudioInput(TEST_WAV)
+    async def test_resume_after_pause(
+        self, audio_in: StubAudioInput, mock_model: MagicMock
+    ) -> None:
+        mock_model.predict.return_value = {"test_model": 0.9}
 
-        with patch("src.wake_word.detector.OWWModel") as MockModel:
-            mock_model = MagicMock()
-            mock_model.predict.return_value = {"test_model": 0.0}
-            MockModel.return_value = mock_model
+        detector = WakeWordDetector(audio_in, wake_word="hey_jarvis", sensitivity=0.5)
+        callback = _AsyncCallCounter()
 
-            detector = WakeWordDetector(
-                audio_in, wake_word="hey_jarvis", sensitivity=0.5
-            )
-            callback = AsyncMock()
+        await detector.start(callback)
+        detector.pause()
+        callback.reset_mock()
 
-            await detector.start(callback)
-            detector.pause()
-            mock_model.reset.reset_mock()
+        # Resume — should detect again
+        detector.resume()
+        assert detector.is_listening
+        await _drain_until(lambda: callback.call_count >= 1)
+        detector.stop()
 
-            detector.resume()
-            mock_model.reset.assert_called()
-            detector.stop()
+        assert callback.call_count >= 1
 
-    async def test_silence_input(self) -> None:
-        audio_in = StubAudioInput()  # No WAV = silence
+    async def test_pause_resets_model(
+        self, audio_in: StubAudioInput, mock_model: MagicMock
+    ) -> None:
+        detector = WakeWordDetector(audio_in, wake_word="hey_jarvis", sensitivity=0.5)
+        callback = _AsyncCallCounter()
 
-        with patch("src.wake_word.detector.OWWModel") as MockModel:
-            mock_model = MagicMock()
-            mock_model.predict.return_value = {"test_model": 0.0}
-            MockModel.return_value = mock_model
+        await detector.start(callback)
+        detector.pause()
+        mock_model.reset.assert_called()
+        detector.stop()
 
-            detector = WakeWordDetector(
-                audio_in, wake_word="hey_jarvis", sensitivity=0.5
-            )
-            callback = AsyncMock()
+    async def test_resume_resets_model(
+        self, audio_in: StubAudioInput, mock_model: MagicMock
+    ) -> None:
+        detector = WakeWordDetector(audio_in, wake_word="hey_jarvis", sensitivity=0.5)
+        callback = _AsyncCallCounter()
 
-            await detector.start(callback)
-            await asyncio.sleep(0.1)
-            detector.stop()
+        await detector.start(callback)
+        detector.pause()
+        mock_model.reset.reset_mock()
 
-            callback.assert_not_called()
+        detector.resume()
+        mock_model.reset.assert_called()
+        detector.stop()
 
-    async def test_stop_closes_audio_input(self) -> None:
-        audio_in = StubAudioInput(TEST_WAV)
+    async def test_silence_input(self, mock_model: MagicMock) -> None:
+        audio_in = StubAudioInput()  # No WAV = silence
 
-        with patch("src.wake_word.detector.OWWModel") as MockModel:
-            mock_model = MagicMock()
-            mock_model.predict.return_value = {"test_model": 0.0}
-            MockModel.return_value = mock_model
+        detector = WakeWordDetector(audio_in, wake_word="hey_jarvis", sensitivity=0.5)
+        callback = _AsyncCallCounter()
 
-            detector = WakeWordDetector(audio_in)
-            callback = AsyncMock()
+        await detector.start(callback)
+        await _drain_until(lambda: mock_model.predict.call_count >= 3)
+        detector.stop()
 
-            await detector.start(callback)
-            assert audio_in.is_open()
+        callback.assert_not_called()
 
-            detector.stop()
-            assert not audio_in.is_open()
+    async def test_stop_closes_audio_input(
+        self, audio_in: StubAudioInput, mock_model: MagicMock
+    ) -> None:
+        detector = WakeWordDetector(audio_in)
+        callback = _AsyncCallCounter()
 
-    async def test_start_is_idempotent(self) -> None:
-        audio_in = StubAudioInput(TEST_WAV)
+        await detector.start(callback)
+        assert audio_in.is_open()
 
-        with patch("src.wake_word.detector.OWWModel") as MockModel:
-            mock_model = MagicMock()
-            mock_model.predict.return_value = {"test_model": 0.0}
-            MockModel.return_value = mock_model
+        detector.stop()
+        assert not audio_in.is_open()
 
-            detector = WakeWordDetector(audio_in)
-            callback = AsyncMock()
+    async def test_start_is_idempotent(
+        self, audio_in: StubAudioInput, mock_model: MagicMock
+    ) -> None:
+        detector = WakeWordDetector(audio_in)
+        callback = _AsyncCallCounter()
 
-            await detector.start(callback)
-            await detector.start(callback)  # Should not create second task
-            assert detector.is_listening
+        await detector.start(callback)
+        await detector.start(callback)  # Should not create second task
+        assert detector.is_listening
 
-            detector.stop()
+        detector.stop()
 
     def test_default_sensitivity(self) -> None:
         audio_in = StubAudioInput()
 
-        with patch("src.wake_word.detector.OWWModel"):
-            detector = WakeWordDetector(audio_in)
-            assert detector._sensitivity == 0.5
+        detector = WakeWordDetector(audio_in)
+        assert detector._sensitivity == 0.5
 
-    async def test_does_not_reopen_already_open_stream(self) -> None:
-        audio_in = StubAudioInput(TEST_WAV)
+    async def test_does_not_reopen_already_open_stream(
+        self, audio_in: StubAudioInput, mock_model: MagicMock
+    ) -> None:
         audio_in.open_stream(sample_rate=16000, chunk_size=1024)
 
-        with patch("src.wake_word.detector.OWWModel") as MockModel:
-            mock_model = MagicMock()
-            mock_model.predict.return_value = {"test_model": 0.0}
-            MockModel.return_value = mock_model
-
-            detector = WakeWordDetector(audio_in)
-            callback = AsyncMock()
+        detector = WakeWordDetector(audio_in)
+        callback = _AsyncCallCounter()
 
-            await detector.start(callback)
-            assert audio_in.is_open()
+        await detector.start(callback)
+        assert audio_in.is_open()
 
-            detector.stop()
+        detector.stop()
 
-    async def test_model_receives_correct_audio_format(self) -> None:
+    async def test_model_receives_correct_audio_format(
+        self, audio_in: StubAudioInput, mock_model: MagicMock
+    ) -> None:
         """Verify that OWW receives int16 numpy arrays of correct size."""
-        audio_in = StubAudioInput(TEST_WAV)
-        received_arrays = []
-
-        with patch("src.wake_word.detector.OWWModel") as MockModel:
-            mock_model = MagicMock()
+        # Only dtype and length are asserted — record those instead of
+        # copying every 1280-sample frame out of the loop.
+        received_shapes = []
 
-            def capture_predict(audio_array):
-                received_arrays.append(audio_array.copy())
-                return {"test_model": 0.0}
+        def capture_predict(audio_array):
+            received_shapes.append((audio_array.dtype.name, audio_array.size))
+            return {"test_model": 0.0}
 
-            mock_model.predict.side_effect = capture_predict
-            MockModel.return_value = mock_model
+        mock_model.predict.side_effect = capture_predict
 
-            detector = WakeWordDetector(audio_in, sensitivity=0.5)
-            callback = AsyncMock()
+        detector = WakeWordDetector(audio_in, sensitivity=0.5)
+        callback = _AsyncCallCounter()
 
-            await detector.start(callback)
-            await asyncio.sleep(0.15)
-            detector.stop()
+        await detector.start(callback)
+        await _drain_until(lambda: len(received_shapes) >= 3)
+        detector.stop()
 
-        assert len(received_arrays) > 0
-        for arr in received_arrays:
-            assert arr.dtype.name == "int16"
-            assert len(arr) == 1280  # OWW frame size
+        assert len(received_shapes) > 0
+        # 1280 samples = one OWW frame
+        assert all(d == "int16" and n == 1280 for d, n in received_shapes)